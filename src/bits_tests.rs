@@ -40,6 +40,33 @@ mod tests {
         assert_eq!(bits.len(), 1);
     }
 
+    #[test]
+    fn from_oct() {
+        let bits = <Tibs as BitCollection>::from_octal("0o7_1 2").unwrap();
+        assert_eq!(bits.to_binary(), "111001010");
+        let bits = <Tibs as BitCollection>::from_octal("8");
+        assert!(bits.is_err());
+        let bits = <Tibs as BitCollection>::from_octal("").unwrap();
+        assert_eq!(bits.len(), 0);
+    }
+
+    #[test]
+    fn eq_string_literal() {
+        let bits = <Tibs as BitCollection>::from_binary("0111").unwrap();
+        assert_eq!(crate::core::eq_string_literal(&bits.data, "0b0111"), Some(true));
+        assert_eq!(crate::core::eq_string_literal(&bits.data, " 0x7"), Some(true));
+        assert_eq!(crate::core::eq_string_literal(&bits.data, "0b01_1"), Some(false));
+        assert_eq!(crate::core::eq_string_literal(&bits.data, "0b01111"), Some(false));
+        assert_eq!(crate::core::eq_string_literal(&bits.data, "0b01, 0b11"), None);
+        assert_eq!(crate::core::eq_string_literal(&bits.data, "0111"), None);
+        let bits = <Tibs as BitCollection>::from_ones(100);
+        assert_eq!(crate::core::eq_string_literal(&bits.data, &format!("0x{}", "f".repeat(25))), Some(true));
+        assert_eq!(crate::core::eq_string_literal(&bits.data, &format!("0x{}e", "f".repeat(24))), Some(false));
+        let bits = <Tibs as BitCollection>::empty();
+        assert_eq!(crate::core::eq_string_literal(&bits.data, "0b"), Some(true));
+        assert_eq!(crate::core::eq_string_literal(&bits.data, "0b0"), Some(false));
+    }
+
     #[test]
     fn from_zeros() {
         let bits = <Tibs as BitCollection>::from_zeros(8);
@@ -197,6 +224,297 @@ mod tests {
         assert_eq!(s._to_int_byte_data(true), vec![255]);
     }
 
+    #[test]
+    fn test_count_ones() {
+        let a = <Tibs as BitCollection>::from_ones(60);
+        assert_eq!(crate::helpers::count_ones(&a.data), 60);
+        let a = <Tibs as BitCollection>::from_ones(200);
+        assert_eq!(crate::helpers::count_ones(&a.data[3..5]), 2);
+        assert_eq!(crate::helpers::count_ones(&a.data[3..190]), 187);
+        let b = <Tibs as BitCollection>::from_binary("0b0110_0000_1111_0000_1000_1").unwrap();
+        assert_eq!(crate::helpers::count_ones(&b.data), 8);
+        assert_eq!(crate::helpers::count_ones(&b.data[1..18]), 7);
+    }
+
+    #[test]
+    fn test_pack_bools() {
+        let bv = crate::helpers::pack_bools(&[1, 0, 2, 255, 0, 0, 0, 1, 9, 0]);
+        assert_eq!(bv.len(), 10);
+        assert_eq!(Tibs::new(bv), Tibs::from_binary("0b1011000110").unwrap());
+        assert_eq!(crate::helpers::pack_bools(&[]).len(), 0);
+    }
+
+    #[test]
+    fn test_validate_index() {
+        use crate::helpers::validate_index;
+        for (index, expected) in [(0, Some(0)), (4, Some(4)), (-1, Some(4)), (-5, Some(0))] {
+            assert_eq!(validate_index(index, 5).ok(), expected);
+        }
+        for index in [5, -6, i64::MAX, i64::MIN, i64::MAX - 2] {
+            assert!(validate_index(index, 5).is_err());
+        }
+        assert!(validate_index(0, 0).is_err());
+        assert!(validate_index(-1, 0).is_err());
+    }
+
+    #[test]
+    fn test_validate_slice() {
+        use crate::helpers::validate_slice;
+        let valid = [
+            ((None, None), (0, 5)),
+            ((Some(1), None), (1, 5)),
+            ((None, Some(-1)), (0, 4)),
+            ((Some(-5), Some(5)), (0, 5)),
+            ((Some(3), Some(3)), (3, 3)),
+        ];
+        for ((start, end), expected) in valid {
+            assert_eq!(validate_slice(5, start, end).ok(), Some(expected));
+        }
+        let invalid = [
+            (Some(-6), None),
+            (None, Some(6)),
+            (Some(4), Some(2)),
+            (Some(i64::MIN), None),
+        ];
+        for (start, end) in invalid {
+            assert!(validate_slice(5, start, end).is_err());
+        }
+    }
+
+    #[test]
+    fn test_find_aligned_bytes() {
+        let hay = <Tibs as BitCollection>::from_bytes(b"abcabcabdxabcabd".to_vec());
+        let needle = <Tibs as BitCollection>::from_bytes(b"abcabd".to_vec());
+        let table = crate::helpers::SearchTable::default();
+        let find = |start, end, reverse| {
+            crate::helpers::find_aligned_bytes(&hay.data, &needle.data, start, end, reverse, &table)
+        };
+        assert_eq!(find(0, 128, false), Some(Some(24)));
+        assert_eq!(find(25, 128, false), Some(Some(80)));
+        assert_eq!(find(0, 128, true), Some(Some(80)));
+        assert_eq!(find(0, 120, true), Some(Some(24)));
+        assert_eq!(find(0, 64, false), Some(None));
+    }
+
+    #[test]
+    fn test_find_aligned_bytes_against_naive() {
+        // Small alphabet so that the rare byte filter sees plenty of false candidates.
+        let hay_bytes: Vec<u8> = (0..300u32)
+            .map(|i| b"ab"[((i * 7 + i / 3) % 2) as usize])
+            .collect();
+        let hay = <Tibs as BitCollection>::from_bytes(hay_bytes.clone());
+        for len in [2, 3, 5, 8, 31, 32, 40] {
+            for offset in [0, 17, 150, 300 - len] {
+                let needle_bytes = hay_bytes[offset..offset + len].to_vec();
+                let needle = <Tibs as BitCollection>::from_bytes(needle_bytes.clone());
+                let first = hay_bytes.windows(len).position(|w| w == needle_bytes);
+                let last = hay_bytes.windows(len).rposition(|w| w == needle_bytes);
+                let table = crate::helpers::SearchTable::default();
+                let search = |reverse| {
+                    let (hay, needle) = (&hay.data, &needle.data);
+                    crate::helpers::find_aligned_bytes(hay, needle, 0, 2400, reverse, &table)
+                };
+                assert_eq!(search(false), Some(first.map(|p| p * 8)));
+                assert_eq!(search(true), Some(last.map(|p| p * 8)));
+            }
+        }
+    }
+
+    #[test]
+    fn test_find_aligned_bytes_long_needle() {
+        // Long enough for the search keyed on byte pairs, in a haystack of few distinct pairs.
+        // Every match is found, as find_all does, sharing one table between the searches.
+        let hay_bytes: Vec<u8> = (0..2u32 << 20)
+            .map(|i| b"abc"[((i * 7 + i / 5) % 3) as usize])
+            .collect();
+        let hay = <Tibs as BitCollection>::from_bytes(hay_bytes.clone());
+        let end = hay.len();
+        for (offset, len) in [(0, 256), (12345, 300), (1 << 20, 1000)] {
+            let mut needle_bytes = hay_bytes[offset..offset + len].to_vec();
+            for _ in 0..2 {
+                let expected: Vec<usize> = (0..=hay_bytes.len() - len)
+                    .filter(|&p| hay_bytes[p..p + len] == needle_bytes[..])
+                    .map(|p| p * 8)
+                    .collect();
+                let needle = <Tibs as BitCollection>::from_bytes(needle_bytes.clone());
+                let table = crate::helpers::search_table(&needle);
+                let mut found = Vec::new();
+                let mut pos = 0;
+                while let Some(p) =
+                    crate::helpers::find_bitvec_with_table(&hay, &needle, pos, end, true, &table)
+                {
+                    found.push(p);
+                    pos = p + 8;
+                }
+                assert_eq!(found, expected);
+                // Then again for a needle that isn't there.
+                needle_bytes[len / 2] = b'x';
+            }
+        }
+    }
+
+    #[cfg(target_arch = "x86_64")]
+    #[test]
+    fn test_candidate_mask_avx2_matches_portable() {
+        use crate::helpers::{candidate_mask, candidate_mask_avx2};
+        if !is_x86_feature_detected!("avx2") {
+            return;
+        }
+        let hay: Vec<u8> = (0..400u32)
+            .map(|i| b"abc"[((i * 7 + i / 3) % 3) as usize])
+            .collect();
+        for offsets in [(0, 1), (0, 5), (3, 40)] {
+            for bytes in [(b'a', b'b'), (b'c', b'c'), (b'a', b'x')] {
+                for i in 0..hay.len() - offsets.1 - 32 {
+                    let portable = candidate_mask(&hay, i, offsets, bytes);
+                    // SAFETY: the CPU was checked for AVX2 above.
+                    let avx2 = unsafe { candidate_mask_avx2(&hay, i, offsets, bytes) };
+                    assert_eq!(portable, avx2);
+                }
+            }
+        }
+    }
+
+    #[test]
+    fn test_contains_each() {
+        let hay = <Tibs as BitCollection>::from_binary("0b0001011").unwrap();
+        let needles: Vec<Tibs> = ["0b1011", "0b11", "0b0001011", "0b10001011", "0b0110", ""]
+            .iter()
+            .map(|s| <Tibs as BitCollection>::from_binary(s).unwrap())
+            .collect();
+        assert_eq!(
+            crate::helpers::contains_each(&hay, &needles),
+            vec![true, true, true, false, false, false]
+        );
+        let long_hay = <Tibs as BitCollection>::from_ones(100);
+        let long = vec![
+            <Tibs as BitCollection>::from_ones(70),
+            <Tibs as BitCollection>::from_ones(101),
+        ];
+        assert_eq!(
+            crate::helpers::contains_each(&long_hay, &long),
+            vec![true, false]
+        );
+    }
+
+    #[test]
+    fn test_find_short_against_naive() {
+        let bits: String = (0..400u32)
+            .map(|i| if (i * i + i / 5) % 3 == 0 { '1' } else { '0' })
+            .collect();
+        let hay = <Tibs as BitCollection>::from_binary(&bits).unwrap();
+        for len in [2, 4, 9, 33, 64] {
+            for offset in [0, 13, 200, 400 - len] {
+                let needle =
+                    <Tibs as BitCollection>::from_binary(&bits[offset..offset + len]).unwrap();
+                for (start, end) in [(0, 400), (5, 390), (offset, offset + len)] {
+                    for byte_aligned in [false, true] {
+                        let matches: Vec<usize> = (start..=end.saturating_sub(len))
+                            .filter(|p| p + len <= end && (!byte_aligned || p % 8 == 0))
+                            .filter(|&p| hay.data[p..p + len] == needle.data)
+                            .collect();
+                        assert_eq!(
+                            crate::helpers::find_bitvec(&hay, &needle, start, end, byte_aligned),
+                            matches.first().copied()
+                        );
+                        assert_eq!(
+                            crate::helpers::rfind_bitvec(
+                                &hay.data,
+                                &needle.data,
+                                start,
+                                end,
+                                byte_aligned
+                            ),
+                            matches.last().copied()
+                        );
+                    }
+                }
+            }
+        }
+    }
+
+    #[test]
+    fn test_find_single_bit() {
+        let a = <Tibs as BitCollection>::from_binary("0b0001011").unwrap();
+        let one = <Tibs as BitCollection>::from_binary("0b1").unwrap();
+        let zero = <Tibs as BitCollection>::from_binary("0b0").unwrap();
+        assert_eq!(crate::helpers::find_bitvec(&a, &one, 0, 7, false), Some(3));
+        assert_eq!(crate::helpers::find_bitvec(&a, &one, 4, 7, false), Some(5));
+        assert_eq!(crate::helpers::find_bitvec(&a, &zero, 3, 7, false), Some(4));
+        assert_eq!(crate::helpers::find_bitvec(&a, &zero, 5, 7, false), None);
+        assert_eq!(crate::helpers::find_bitvec(&a, &one, 7, 7, false), None);
+    }
+
+    #[test]
+    fn test_first_bit_against_naive() {
+        // A lone set bit in a run of zeros, and a lone zero in a run of ones, at every position.
+        for len in [1, 5, 8, 9, 64, 71, 200] {
+            for target in 0..len {
+                let mut zeros = <Tibs as BitCollection>::from_zeros(len);
+                zeros.data.set(target, true);
+                let mut ones = <Tibs as BitCollection>::from_ones(len);
+                ones.data.set(target, false);
+                for start in [0, 1, 3, 8, 13].into_iter().filter(|&s| s <= target) {
+                    for end in [target + 1, len] {
+                        let expected = Some(target - start);
+                        let found = crate::helpers::first_bit(&zeros.data[start..end], true);
+                        assert_eq!(found, expected, "{len} {target} {start} {end}");
+                        let found = crate::helpers::first_bit(&ones.data[start..end], false);
+                        assert_eq!(found, expected, "{len} {target} {start} {end}");
+                    }
+                    let window = &zeros.data[start..target];
+                    assert_eq!(crate::helpers::first_bit(window, true), None);
+                }
+            }
+        }
+    }
+
+    #[test]
+    fn test_bin_and_hex_strings() {
+        let pattern = "0001001000110100010101100111100010011010101111001101111011110000".repeat(3);
+        for len in (0..=pattern.len()).step_by(4) {
+            let t = <Tibs as BitCollection>::from_binary(&pattern[..len]).unwrap();
+            assert_eq!(t.to_binary(), &pattern[..len]);
+            let expected: String = (0..len / 4)
+                .map(|i| {
+                    let digit = u32::from_str_radix(&pattern[4 * i..4 * i + 4], 2).unwrap();
+                    char::from_digit(digit, 16).unwrap()
+                })
+                .collect();
+            assert_eq!(t.to_hexadecimal().unwrap(), expected);
+        }
+        // Bits that start part way into the first byte.
+        let mut m = Mutibs::from_binary("1010001001000110100").unwrap();
+        m.inner.data = m.inner.data[3..].to_bitvec();
+        assert_eq!(m.inner.to_hexadecimal().unwrap(), "1234");
+        assert_eq!(m.inner.to_binary(), "0001001000110100");
+    }
+
+    #[test]
+    fn test_repeat_against_string() {
+        let pattern = "1101001110001011110";
+        for len in 1..pattern.len() {
+            let t = <Tibs as BitCollection>::from_binary(&pattern[..len]).unwrap();
+            for n in [1, 2, 3, 7, 8, 9, 17, 100] {
+                assert_eq!(t.repeat(n).unwrap().to_bin(), pattern[..len].repeat(n as usize));
+            }
+        }
+        // The inner Tibs of a Mutibs needn't start at the front of its buffer.
+        let mut m = Mutibs::from_binary("0111011").unwrap();
+        m.inner.data = m.inner.data[3..].to_bitvec();
+        assert_eq!(m.inner.repeat(3).unwrap().to_bin(), "101110111011");
+    }
+
+    #[test]
+    fn test_last_byte_mask() {
+        let masks: Vec<u8> = (0..=16).map(crate::helpers::last_byte_mask).collect();
+        assert_eq!(
+            masks[..9],
+            [0xff, 0x80, 0xc0, 0xe0, 0xf0, 0xf8, 0xfc, 0xfe, 0xff]
+        );
+        assert_eq!(masks[8..], masks[..9]);
+    }
+
     #[test]
     fn test_from_oct() {
         let bits = <Tibs as BitCollection>::from_octal("123").unwrap();
@@ -270,6 +588,54 @@ mod tests {
         assert_eq!(result.to_bin(), "1000");
     }
 
+    #[test]
+    fn test_bitwise_ops_wordwise() {
+        let pattern = "1101001110001011110".repeat(12);
+        for len in [1, 7, 8, 9, 63, 64, 65, 130, 200] {
+            let a = <Tibs as BitCollection>::from_binary(&pattern[..len]).unwrap();
+            let b = <Tibs as BitCollection>::from_binary(&pattern[17..17 + len]).unwrap();
+            let bit_by_bit = |op: fn(bool, bool) -> bool| -> String {
+                (0..len)
+                    .map(|i| if op(a.data[i], b.data[i]) { '1' } else { '0' })
+                    .collect()
+            };
+            assert_eq!(a._and(&b).unwrap().to_bin(), bit_by_bit(|x, y| x & y));
+            assert_eq!(a._or(&b).unwrap().to_bin(), bit_by_bit(|x, y| x | y));
+            assert_eq!(a._xor(&b).unwrap().to_bin(), bit_by_bit(|x, y| x ^ y));
+            let inverted = a.__invert__().unwrap();
+            assert_eq!(inverted.to_bin(), bit_by_bit(|x, _| !x));
+            // The unused bits of the final byte must stay clear.
+            assert!(inverted.eq_canonical(&Tibs::from_binary(&inverted.to_bin()).unwrap()));
+        }
+        // A Mutibs can hold bits that don't start at the front of their first byte.
+        let mut m = Mutibs::from_binary("11100110101").unwrap();
+        m.inner.data = m.inner.data[3..].to_bitvec();
+        let b = <Tibs as BitCollection>::from_binary("11110000").unwrap();
+        assert_eq!(m._xor(&b).unwrap().to_bin(), "11000101");
+        assert_eq!(b._and(&m.inner).unwrap().to_bin(), "00110000");
+    }
+
+    #[test]
+    fn test_hash_ignores_layout() {
+        use std::collections::hash_map::DefaultHasher;
+        use std::hash::{Hash, Hasher};
+        let hash_of = |t: &Tibs| {
+            let mut hasher = DefaultHasher::new();
+            t.hash(&mut hasher);
+            hasher.finish()
+        };
+        let t = Tibs::from_binary("1011001110").unwrap();
+        let mut m = Mutibs::from_binary("01110110011101").unwrap();
+        m.inner.data = m.inner.data[3..].to_bitvec();
+        m.inner.data.pop();
+        assert_eq!(hash_of(&m.inner), hash_of(&t));
+        let mut junk_tail = Mutibs::from_binary("10110011101").unwrap();
+        junk_tail.inner.data.pop();
+        assert_eq!(hash_of(&junk_tail.inner), hash_of(&t));
+        let longer = Tibs::from_binary("10110011100").unwrap();
+        assert_ne!(hash_of(&t), hash_of(&longer));
+    }
+
     #[test]
     fn test_from_bytes_with_offset() {
         let bits = Tibs::_from_bytes_with_offset(vec![0b11110000], 4);
@@ -1,11 +1,11 @@
 use crate::tibs_::Tibs;
-use crate::helpers::{validate_index, BV};
+use crate::helpers::{
+    append_bits, combine_words, eq_bits, invert_words, last_byte_mask, validate_index, write_bits,
+    BS, BV,
+};
 use crate::mutibs::Mutibs;
-use bitvec::bits;
 use bitvec::field::BitField;
-use bitvec::order::Msb0;
 use bitvec::prelude::Lsb0;
-use bitvec::view::BitView;
 use lru::LruCache;
 use once_cell::sync::{Lazy, OnceCell};
 use pyo3::exceptions::PyValueError;
@@ -41,6 +41,9 @@ pub(crate) trait BitCollection: Sized {
 
 // Define a static LRU cache.
 const BITS_CACHE_SIZE: usize = 1024;
+// Only strings up to this length are cached. Longer ones are rarely repeated, and would push out
+// the short literals that are, as well as making each lookup hash and each insert copy more.
+const BITS_CACHE_MAX_STR_LEN: usize = 64;
 static BITS_CACHE: Lazy<Mutex<LruCache<String, BV>>> =
     Lazy::new(|| Mutex::new(LruCache::new(NonZeroUsize::new(BITS_CACHE_SIZE).unwrap())));
 
@@ -67,11 +70,161 @@ fn split_tokens(s: &String) -> Vec<String> {
     tokens
 }
 
+const SKIP: u8 = 0xfe;
+const INVALID: u8 = 0xff;
+
+// Lookup table from an ASCII byte to its hex digit value, or SKIP for underscores and whitespace.
+static DIGIT_TABLE: [u8; 256] = build_digit_table();
+
+const fn build_digit_table() -> [u8; 256] {
+    let mut table = [INVALID; 256];
+    let mut i = 0;
+    while i < 10 {
+        table[b'0' as usize + i] = i as u8;
+        i += 1;
+    }
+    let mut i = 0;
+    while i < 6 {
+        table[b'a' as usize + i] = 10 + i as u8;
+        table[b'A' as usize + i] = 10 + i as u8;
+        i += 1;
+    }
+    table[b'_' as usize] = SKIP;
+    table[b' ' as usize] = SKIP;
+    // Tab, line feed, vertical tab, form feed and carriage return.
+    let mut i = 0x09;
+    while i <= 0x0d {
+        table[i] = SKIP;
+        i += 1;
+    }
+    table
+}
+
+// Lookup tables from a byte to its eight binary digits and to its two hex digits.
+static BYTE_TO_BIN: [[u8; 8]; 256] = build_byte_to_bin();
+static BYTE_TO_HEX: [[u8; 2]; 256] = build_byte_to_hex();
+
+const fn build_byte_to_bin() -> [[u8; 8]; 256] {
+    let mut table = [[0u8; 8]; 256];
+    let mut b = 0;
+    while b < 256 {
+        let mut i = 0;
+        while i < 8 {
+            table[b][i] = b'0' + ((b >> (7 - i)) & 1) as u8;
+            i += 1;
+        }
+        b += 1;
+    }
+    table
+}
+
+const fn build_byte_to_hex() -> [[u8; 2]; 256] {
+    const DIGITS: &[u8; 16] = b"0123456789abcdef";
+    let mut table = [[0u8; 2]; 256];
+    let mut b = 0;
+    while b < 256 {
+        table[b] = [DIGITS[b >> 4], DIGITS[b & 0xf]];
+        b += 1;
+    }
+    table
+}
+
+/// Parse binary, octal or hex digits in a single pass, packing them straight into bytes.
+///
+/// Underscores and whitespace are ignored. On failure the first invalid character is returned.
+fn parse_digits(s: &str, bits_per_digit: usize) -> Result<BV, char> {
+    if !s.is_ascii() {
+        // Only whitespace can be skipped outside of the lookup table.
+        let filtered: String = s.chars().filter(|c| !c.is_whitespace()).collect();
+        if filtered.len() != s.len() {
+            return parse_digits(&filtered, bits_per_digit);
+        }
+    }
+    let mut bytes = Vec::<u8>::with_capacity(s.len() * bits_per_digit / 8 + 1);
+    let mut acc: u32 = 0;
+    let mut acc_bits = 0;
+    let mut length = 0;
+    for (i, &b) in s.as_bytes().iter().enumerate() {
+        let value = DIGIT_TABLE[b as usize];
+        if value == SKIP {
+            continue;
+        }
+        if value >> bits_per_digit != 0 {
+            return Err(s[i..].chars().next().unwrap());
+        }
+        acc = (acc << bits_per_digit) | value as u32;
+        acc_bits += bits_per_digit;
+        if acc_bits >= 8 {
+            acc_bits -= 8;
+            bytes.push((acc >> acc_bits) as u8);
+        }
+        length += bits_per_digit;
+    }
+    if acc_bits > 0 {
+        bytes.push((acc << (8 - acc_bits)) as u8);
+    }
+    let mut bv = BV::from_vec(bytes);
+    bv.truncate(length);
+    Ok(bv)
+}
+
+/// Compare bits with a single '0b', '0o' or '0x' literal without building a new Tibs.
+///
+/// Returns None if the string isn't a simple literal, in which case it should be parsed in full.
+pub(crate) fn eq_string_literal(bits: &BS, s: &str) -> Option<bool> {
+    let s = s.trim_start_matches(|c: char| c.is_ascii_whitespace());
+    if !s.is_ascii() {
+        return None;
+    }
+    let bits_per_digit = match s.as_bytes() {
+        [b'0', b'b' | b'B', ..] => 1,
+        [b'0', b'o' | b'O', ..] => 3,
+        [b'0', b'x' | b'X', ..] => 4,
+        _ => return None,
+    };
+    let digits = &s.as_bytes()[2..];
+    let mut pos = 0;
+    if bits.len() <= 64 {
+        // Accumulate the literal into a single word and do one comparison at the end.
+        let mut word = 0u64;
+        for &b in digits {
+            let value = DIGIT_TABLE[b as usize];
+            if value == SKIP {
+                continue;
+            }
+            if value >> bits_per_digit != 0 {
+                return None;
+            }
+            if pos + bits_per_digit > bits.len() {
+                return Some(false);
+            }
+            word = (word << bits_per_digit) | value as u64;
+            pos += bits_per_digit;
+        }
+        return Some(pos == bits.len() && (pos == 0 || bits.load_be::<u64>() == word));
+    }
+    for &b in digits {
+        let value = DIGIT_TABLE[b as usize];
+        if value == SKIP {
+            continue;
+        }
+        if value >> bits_per_digit != 0 {
+            // Could be a comma separated list, or just invalid.
+            return None;
+        }
+        if pos + bits_per_digit > bits.len() || bits[pos..pos + bits_per_digit].load_be::<u8>() != value {
+            return Some(false);
+        }
+        pos += bits_per_digit;
+    }
+    Some(pos == bits.len())
+}
+
 fn string_literal_to_tibs(s: &str) -> PyResult<Tibs> {
-    match s.get(0..2).map(|p| p.to_ascii_lowercase()).as_deref() {
-        Some("0b") => Ok(Tibs::_from_bin(s)?),
-        Some("0x") => Ok(Tibs::_from_hex(s)?),
-        Some("0o") => Ok(Tibs::_from_oct(s)?),
+    match s.as_bytes() {
+        [b'0', b'b' | b'B', ..] => Ok(Tibs::_from_bin(s)?),
+        [b'0', b'x' | b'X', ..] => Ok(Tibs::_from_hex(s)?),
+        [b'0', b'o' | b'O', ..] => Ok(Tibs::_from_oct(s)?),
         _ => Err(PyValueError::new_err(format!(
             "Can't parse token '{s}'. Did you mean to prefix with '0x', '0b' or '0o'?"
         )))
@@ -79,39 +232,44 @@ fn string_literal_to_tibs(s: &str) -> PyResult<Tibs> {
 }
 
 pub(crate) fn str_to_tibs(s: String) -> PyResult<Tibs> {
+    let use_cache = s.len() <= BITS_CACHE_MAX_STR_LEN;
     // Check cache first
-    {
+    if use_cache {
         let mut cache = BITS_CACHE.lock().unwrap();
         if let Some(cached_data) = cache.get(&s) {
             return Ok(Tibs::new(cached_data.clone()));
         }
     }
-    let tokens = split_tokens(&s);
-    let mut bits_array = Vec::<Tibs>::new();
-    let mut total_bit_length = 0;
-    for token in tokens {
-        if token.is_empty() {
-            continue;
-        }
-        let x= string_literal_to_tibs(&token)?;
-        total_bit_length += x.len();
-        bits_array.push(x);
-    }
-    if bits_array.is_empty() {
-        return Ok(BitCollection::empty());
-    }
-    // Combine all bits
-    let result = if bits_array.len() == 1 {
-        bits_array.pop().unwrap()
+    let trimmed = s.trim();
+    let result = if !trimmed.contains(',')
+        && matches!(trimmed.as_bytes(), [b'0', b'b' | b'B' | b'o' | b'O' | b'x' | b'X', ..])
+    {
+        // A single literal. The digit parser skips whitespace itself, so there's no need to tokenise.
+        string_literal_to_tibs(trimmed)?
     } else {
-        let mut result = BV::with_capacity(total_bit_length);
-        for bits in bits_array {
-            result.extend_from_bitslice(&bits.data);
+        let tokens = split_tokens(&s);
+        let mut bits_array = Vec::<Tibs>::new();
+        let mut total_bit_length = 0;
+        for token in tokens {
+            if token.is_empty() {
+                continue;
+            }
+            let x= string_literal_to_tibs(&token)?;
+            total_bit_length += x.len();
+            bits_array.push(x);
+        }
+        if bits_array.is_empty() {
+            return Ok(BitCollection::empty());
+        }
+        // Combine all bits
+        if bits_array.len() == 1 {
+            bits_array.pop().unwrap()
+        } else {
+            Tibs::join(&bits_array, total_bit_length)
         }
-        Tibs::new(result)
     };
     // Update cache with new result
-    {
+    if use_cache {
         let mut cache = BITS_CACHE.lock().unwrap();
         cache.put(s, result.data.clone());
     }
@@ -136,89 +294,57 @@ impl BitCollection for Tibs {
 
     #[inline]
     fn from_zeros(length: usize) -> Self {
-        Tibs::new(BV::repeat(false, length))
+        // A zeroed Vec can come straight from the allocator as pre-zeroed memory.
+        let mut bv = BV::from_vec(vec![0u8; length.div_ceil(8)]);
+        bv.truncate(length);
+        Tibs::new(bv)
     }
 
     #[inline]
     fn from_ones(length: usize) -> Self {
-        Tibs::new(BV::repeat(true, length))
+        let mut bv = BV::from_vec(vec![0xffu8; length.div_ceil(8)]);
+        bv.truncate(length);
+        Tibs::new(bv)
     }
 
     #[inline]
     fn from_bytes(data: Vec<u8>) -> Self {
-        let bits = data.view_bits::<Msb0>();
-        let bv = BV::from_bitslice(bits);
-        Tibs::new(bv)
+        // Take ownership of the buffer rather than copying it.
+        Tibs::new(BV::from_vec(data))
     }
 
     #[inline]
     fn from_binary(binary_string: &str) -> Result<Self, String> {
         // Ignore any leading '0b' or '0B'
         let s = binary_string.strip_prefix("0b").or_else(|| binary_string.strip_prefix("0B")).unwrap_or(binary_string);
-        let mut b: BV = BV::with_capacity(s.len());
-        for c in s.chars() {
-            match c {
-                '0' => b.push(false),
-                '1' => b.push(true),
-                '_' => continue,
-                c if c.is_whitespace() => continue,
-                _ => {
-                    return Err(format!(
-                        "Cannot convert from bin '{binary_string}: Invalid character '{c}'."
-                    ))
-                }
-            }
+        match parse_digits(s, 1) {
+            Ok(bv) => Ok(Tibs::new(bv)),
+            Err(c) => Err(format!(
+                "Cannot convert from bin '{binary_string}: Invalid character '{c}'."
+            )),
         }
-        b.set_uninitialized(false);
-        Ok(Tibs::new(b))
     }
 
     #[inline]
     fn from_octal(octal_string: &str) -> Result<Self, String> {
         // Ignore any leading '0o'
         let s = octal_string.strip_prefix("0o").or_else(|| octal_string.strip_prefix("0O")).unwrap_or(octal_string);
-        let mut b: BV = BV::with_capacity(s.len() * 3);
-        for c in s.chars() {
-            match c {
-                '0' => b.extend_from_bitslice(bits![0, 0, 0]),
-                '1' => b.extend_from_bitslice(bits![0, 0, 1]),
-                '2' => b.extend_from_bitslice(bits![0, 1, 0]),
-                '3' => b.extend_from_bitslice(bits![0, 1, 1]),
-                '4' => b.extend_from_bitslice(bits![1, 0, 0]),
-                '5' => b.extend_from_bitslice(bits![1, 0, 1]),
-                '6' => b.extend_from_bitslice(bits![1, 1, 0]),
-                '7' => b.extend_from_bitslice(bits![1, 1, 1]),
-                '_' => continue,
-                c if c.is_whitespace() => continue,
-                _ => {
-                    return Err(format!(
-                        "Cannot convert from oct '{octal_string}': Invalid character '{c}'."
-                    ))
-                }
-            }
+        match parse_digits(s, 3) {
+            Ok(bv) => Ok(Tibs::new(bv)),
+            Err(c) => Err(format!(
+                "Cannot convert from oct '{octal_string}': Invalid character '{c}'."
+            )),
         }
-        Ok(Tibs::new(b))
     }
 
     #[inline]
     fn from_hexadecimal(hex: &str) -> Result<Self, String> {
         // Ignore any leading '0x'
-        let mut new_hex = hex.strip_prefix("0x").or_else(|| hex.strip_prefix("0X")).unwrap_or(hex).to_string();
-        // Remove any underscores or whitespace characters
-        new_hex.retain(|c| c != '_' && !c.is_whitespace());
-        let is_odd_length: bool = new_hex.len() % 2 != 0;
-        if is_odd_length {
-            new_hex.push('0');
-        }
-        let data = match hex::decode(new_hex) {
-            Ok(d) => d,
-            Err(e) => return Err(format!("Cannot convert from hex '{hex}': {}", e)),
-        };
-        let mut bv = <Tibs as BitCollection>::from_bytes(data).data;
-        if is_odd_length {
-            bv.drain(bv.len() - 4..bv.len());
+        let s = hex.strip_prefix("0x").or_else(|| hex.strip_prefix("0X")).unwrap_or(hex);
+        match parse_digits(s, 4) {
+            Ok(bv) => Ok(Tibs::new(bv)),
+            Err(c) => Err(format!("Cannot convert from hex '{hex}': Invalid character '{c}'.")),
         }
-        Ok(Tibs::new(bv))
     }
 
     #[inline]
@@ -237,23 +363,17 @@ impl BitCollection for Tibs {
 
     #[inline]
     fn logical_or(&self, other: &Tibs) -> Self {
-        debug_assert!(self.len() == other.len());
-        let result = self.data.clone() | &other.data;
-        Tibs::new(result)
+        self.combine(other, |a, b| a | b)
     }
 
     #[inline]
     fn logical_and(&self, other: &Tibs) -> Self {
-        debug_assert!(self.len() == other.len());
-        let result = self.data.clone() & &other.data;
-        Tibs::new(result)
+        self.combine(other, |a, b| a & b)
     }
 
     #[inline]
     fn logical_xor(&self, other: &Tibs) -> Self {
-        debug_assert!(self.len() == other.len());
-        let result = self.data.clone() ^ &other.data;
-        Tibs::new(result)
+        self.combine(other, |a, b| a ^ b)
     }
 
     #[inline]
@@ -263,51 +383,27 @@ impl BitCollection for Tibs {
 
     #[inline]
     fn to_binary(&self) -> String {
+        // Only short strings are cached, as longer ones would use too much memory.
         if self.len() > 64 {
             return self.build_bin_string();
         }
-        self.build_bin_string()
-        // self.bin_cache.get_or_init(|| {
-        //     self.build_bin_string()
-        // }).clone()
+        self.bin_cache.get_or_init(|| self.build_bin_string()).clone()
     }
 
-
     #[inline]
     fn to_octal(&self) -> Result<String, String> {
-        let len = self.len();
-        if len % 3 != 0 {
-            return Err(format!(
-                "Cannot interpret as octal - length of {} is not a multiple of 3 bits.",
-                len
-            ));
-        }
-        if len > 64 {
-            return Ok(self.build_oct_string());
+        if self.len() > 64 {
+            return self.build_oct_string_checked();
         }
-        Ok(self.build_oct_string())
-        // Ok(self.oct_cache.get_or_init(|| {
-        //     self.build_oct_string()
-        // }).clone())
+        self.oct_cache.get_or_try_init(|| self.build_oct_string_checked()).cloned()
     }
 
     #[inline]
     fn to_hexadecimal(&self) -> Result<String, String> {
-        let len = self.len();
-        if len % 4 != 0 {
-            return Err(format!(
-                "Cannot interpret as hex - length of {} is not a multiple of 4 bits.",
-                len
-            ));
-        }
-        if len > 64 {
-            return Ok(self.build_hex_string());
+        if self.len() > 64 {
+            return self.build_hex_string_checked();
         }
-        Ok(self.build_hex_string())
-        // Ok(self.hex_cache.get_or_init(|| {
-        //     self.build_hex_string()
-        // }).clone())
-
+        self.hex_cache.get_or_try_init(|| self.build_hex_string_checked()).cloned()
     }
 }
 
@@ -412,19 +508,20 @@ impl BitCollection for Mutibs {
         self.inner.data[i]
     }
 
+    // The Tibs string caches would go stale as the data is mutated, so they are bypassed here.
     #[inline]
     fn to_binary(&self) -> String {
-        self.inner.to_binary()
+        self.inner.build_bin_string()
     }
 
     #[inline]
     fn to_octal(&self) -> Result<String, String> {
-        self.inner.to_octal()
+        self.inner.build_oct_string_checked()
     }
 
     #[inline]
     fn to_hexadecimal(&self) -> Result<String, String> {
-        self.inner.to_hexadecimal()
+        self.inner.build_hex_string_checked()
     }
 }
 
@@ -457,79 +554,225 @@ impl fmt::Debug for Tibs {
 impl PartialEq for Tibs {
     #[inline]
     fn eq(&self, other: &Self) -> bool {
-        self.data == other.data
+        eq_bits(&self.data, &other.data)
     }
 }
 
 impl PartialEq<Mutibs> for Tibs {
     #[inline]
     fn eq(&self, other: &Mutibs) -> bool {
-        self.data == other.inner.data
+        eq_bits(&self.data, &other.inner.data)
     }
 }
 
 impl PartialEq for Mutibs {
     #[inline]
     fn eq(&self, other: &Self) -> bool {
-        self.inner.data == other.inner.data
+        eq_bits(&self.inner.data, &other.inner.data)
     }
 }
 
 impl PartialEq<Tibs> for Mutibs {
     #[inline]
     fn eq(&self, other: &Tibs) -> bool {
-        self.inner.data == other.data
+        eq_bits(&self.inner.data, &other.data)
     }
 }
 
 // ---- Tibs private helper methods. Not part of the Python interface. ----
 
 impl Tibs {
-    pub(crate) fn new(bv: BV) -> Self {
+    pub(crate) fn new(mut bv: BV) -> Self {
+        // Keep a canonical layout: the bits start at the front of the buffer and any unused bits in the
+        // final byte are zero. Aligning is a no-op in the common case and the tail is a single mask.
+        bv.force_align();
+        let len = bv.len();
+        if let Some(last) = bv.as_raw_mut_slice().last_mut() {
+            *last &= last_byte_mask(len);
+        }
         Tibs {
             data: bv,
             bin_cache: OnceCell::new(),
             oct_cache: OnceCell::new(),
             hex_cache: OnceCell::new(),
+            hash_cache: OnceCell::new(),
+        }
+    }
+
+    /// Concatenate Tibs whose lengths add up to `total_len`.
+    ///
+    /// Every Tibs is stored from the start of its buffer with a zeroed tail, so the parts can be
+    /// joined a byte at a time into the one buffer, shifting them when the join isn't on a byte
+    /// boundary.
+    pub(crate) fn join<'a>(parts: impl IntoIterator<Item = &'a Tibs>, total_len: usize) -> Tibs {
+        let mut bytes: Vec<u8> = Vec::with_capacity(total_len.div_ceil(8));
+        let mut joined_len = 0;
+        for bits in parts {
+            append_bits(&mut bytes, joined_len, bits.data.as_raw_slice(), bits.len());
+            joined_len += bits.len();
+        }
+        debug_assert_eq!(joined_len, total_len);
+        let mut bv = BV::from_vec(bytes);
+        bv.truncate(total_len);
+        Tibs::new(bv)
+    }
+
+    /// Equality between two Tibs as a plain byte comparison. This relies on the canonical layout
+    /// from Tibs::new, so it mustn't be used for the inner Tibs of a Mutibs.
+    ///
+    /// If both hashes have already been calculated then differing hashes settle it without
+    /// looking at the data.
+    #[inline]
+    pub(crate) fn eq_canonical(&self, other: &Tibs) -> bool {
+        if self.len() != other.len() {
+            return false;
+        }
+        if let (Some(a), Some(b)) = (self.hash_cache.get(), other.hash_cache.get()) {
+            if a != b {
+                return false;
+            }
         }
+        self.data.as_raw_slice() == other.data.as_raw_slice()
+    }
+
+    /// Bit-wise combination of two Tibs of equal length, done a word at a time on the raw bytes.
+    /// The result starts as an aligned copy of self, and other is only realigned if it has a bit
+    /// offset within its first byte. Any junk in the final byte is cleared by Tibs::new.
+    fn combine(&self, other: &Tibs, op: impl Fn(u64, u64) -> u64) -> Tibs {
+        debug_assert!(self.len() == other.len());
+        let mut result = self.data.clone();
+        result.force_align();
+        if other.data.as_bitptr().bit().into_inner() == 0 {
+            combine_words(result.as_raw_mut_slice(), other.data.as_raw_slice(), op);
+        } else {
+            let mut rhs = other.data.clone();
+            rhs.force_align();
+            combine_words(result.as_raw_mut_slice(), rhs.as_raw_slice(), op);
+        }
+        Tibs::new(result)
+    }
+
+    /// Every bit inverted, done a word at a time on the raw bytes.
+    pub(crate) fn inverted(&self) -> Tibs {
+        let mut result = self.data.clone();
+        result.force_align();
+        invert_words(result.as_raw_mut_slice());
+        Tibs::new(result)
     }
 
     /// Slice used internally without bounds checking.
+    ///
+    /// The bits are copied to the start of a new buffer. to_bitvec() would keep the source's bit offset
+    /// within the first byte, which pushes later byte-level operations onto their slow misaligned paths.
+    /// A slice starting on a byte boundary of an aligned buffer is a straight copy of the raw bytes.
     pub(crate) fn slice(&self, start_bit: usize, length: usize) -> Self {
-        Tibs::new(self.data[start_bit..start_bit + length].to_bitvec())
+        if start_bit % 8 == 0 && self.data.as_bitptr().bit().into_inner() == 0 {
+            let first = start_bit / 8;
+            let bytes = &self.data.as_raw_slice()[first..first + length.div_ceil(8)];
+            let mut bv = BV::from_vec(bytes.to_vec());
+            bv.truncate(length);
+            return Tibs::new(bv);
+        }
+        let mut bv = BV::with_capacity(length);
+        bv.extend_from_bitslice(&self.data[start_bit..start_bit + length]);
+        Tibs::new(bv)
+    }
+
+    /// The string used for __str__. Mutibs passes use_cache = false as its data can change.
+    pub(crate) fn build_str(&self, use_cache: bool) -> String {
+        if self.is_empty() {
+            return "".to_string();
+        }
+        const MAX_BITS_TO_PRINT: usize = 10000;
+        debug_assert!(MAX_BITS_TO_PRINT % 4 == 0);
+        if self.len() <= MAX_BITS_TO_PRINT {
+            let hex = if use_cache {
+                self.to_hexadecimal()
+            } else {
+                self.build_hex_string_checked()
+            };
+            match hex {
+                Ok(hex) => format!("0x{}", hex),
+                Err(_) => format!("0b{}", self.build_bin_string()),
+            }
+        } else {
+            format!(
+                "0x{}... # length={}",
+                self.slice(0, MAX_BITS_TO_PRINT).build_hex_string(),
+                self.len()
+            )
+        }
+    }
+
+    fn build_oct_string_checked(&self) -> Result<String, String> {
+        let len = self.len();
+        if len % 3 != 0 {
+            return Err(format!(
+                "Cannot interpret as octal - length of {} is not a multiple of 3 bits.",
+                len
+            ));
+        }
+        Ok(self.build_oct_string())
+    }
+
+    fn build_hex_string_checked(&self) -> Result<String, String> {
+        let len = self.len();
+        if len % 4 != 0 {
+            return Err(format!(
+                "Cannot interpret as hex - length of {} is not a multiple of 4 bits.",
+                len
+            ));
+        }
+        Ok(self.build_hex_string())
+    }
+
+    /// Unpack consecutive `width`-bit fields into digit characters.
+    ///
+    /// For binary and hex the whole bytes are converted with a table lookup per byte. Otherwise
+    /// as many whole fields as fit in a u64 are loaded at once, then split out with shifts.
+    fn build_digit_string(&self, width: usize) -> String {
+        const DIGITS: &[u8; 16] = b"0123456789abcdef";
+        debug_assert!(width == 1 || width == 3 || width == 4);
+        debug_assert!(self.len() % width == 0);
+        let mut s = Vec::<u8>::with_capacity(self.len() / width);
+        let mut done = 0;
+        if width != 3 && self.data.as_bitptr().bit().into_inner() == 0 {
+            let whole = &self.data.as_raw_slice()[..self.len() / 8];
+            if width == 1 {
+                for &b in whole {
+                    s.extend_from_slice(&BYTE_TO_BIN[b as usize]);
+                }
+            } else {
+                for &b in whole {
+                    s.extend_from_slice(&BYTE_TO_HEX[b as usize]);
+                }
+            }
+            done = whole.len() * 8;
+        }
+        let mask = (1u64 << width) - 1;
+        for chunk in self.data[done..].chunks((64 / width) * width) {
+            let word = chunk.load_be::<u64>();
+            for i in (0..chunk.len() / width).rev() {
+                s.push(DIGITS[((word >> (i * width)) & mask) as usize]);
+            }
+        }
+        // Only ASCII digits have been pushed.
+        String::from_utf8(s).unwrap()
     }
 
     #[inline]
     fn build_bin_string(&self) -> String {
-        let mut s = String::with_capacity(self.len());
-        for i in 0..self.len() {
-            s.push(if self.get_bit(i) { '1' } else { '0' });
-        }
-        s
+        self.build_digit_string(1)
     }
 
     #[inline]
     fn build_oct_string(&self) -> String {
-        debug_assert!(self.len() % 3 == 0);
-        let mut s = String::with_capacity(self.len() / 3);
-        for chunk in self.data.chunks(3) {
-            let tribble = chunk.load_be::<u8>();
-            let oct_char = std::char::from_digit(tribble as u32, 8).unwrap();
-            s.push(oct_char);
-        }
-        s
+        self.build_digit_string(3)
     }
 
     #[inline]
     fn build_hex_string(&self) -> String {
-        debug_assert!(self.len() % 4 == 0);
-        let mut s = String::with_capacity(self.len() / 4);
-        for chunk in self.data.chunks(4) {
-            let nibble = chunk.load_be::<u8>();
-            let hex_char = std::char::from_digit(nibble as u32, 16).unwrap();
-            s.push(hex_char);
-        }
-        s
+        self.build_digit_string(4)
     }
 }
 
@@ -548,9 +791,84 @@ impl Mutibs {
         }
     }
 
+    /// Replace bits [start, end) with `value`.
+    ///
+    /// The tail is moved in place, so no temporary copy of it is made.
+    pub(crate) fn splice(&mut self, start: usize, end: usize, value: &BS) {
+        let data = &mut self.inner.data;
+        let old_len = data.len();
+        let new_end = start + value.len();
+        if new_end > end {
+            data.resize(old_len + (new_end - end), false);
+            data.copy_within(end..old_len, new_end);
+        } else if new_end < end {
+            data.copy_within(end..old_len, new_end);
+            data.truncate(old_len - (end - new_end));
+        }
+        write_bits(data, start, value);
+    }
+
+    /// Append a copy of the Mutibs to itself, reusing the existing buffer where there is capacity.
+    pub(crate) fn append_self(&mut self) {
+        let data = &mut self.inner.data;
+        let len = data.len();
+        data.resize(2 * len, false);
+        data.copy_within(..len, len);
+    }
+
+    /// Replace the `old_len` bits at each of the sorted, non-overlapping `starting_points` with
+    /// `new`, working on the raw bytes. All the positions and both lengths must be whole bytes.
+    pub(crate) fn replace_whole_bytes(
+        &mut self,
+        starting_points: &[usize],
+        old_len: usize,
+        new: &Tibs,
+    ) {
+        debug_assert!(old_len % 8 == 0 && new.len() % 8 == 0);
+        debug_assert!(starting_points.iter().all(|p| p % 8 == 0));
+        let data = &mut self.inner.data;
+        data.force_align();
+        let count = starting_points.len();
+        let new_len = data.len() - count * old_len + count * new.len();
+        let mut replacement_bits = new.data.clone();
+        replacement_bits.force_align();
+        let replacement = replacement_bits.as_raw_slice();
+        let old_bytes = old_len / 8;
+        if new.len() <= old_len {
+            // Compact in place. The write position never overtakes the read position.
+            let raw = data.as_raw_mut_slice();
+            let mut write = starting_points.first().map_or(0, |p| p / 8);
+            let mut read = write;
+            for &pos in starting_points {
+                let p = pos / 8;
+                raw.copy_within(read..p, write);
+                write += p - read;
+                raw[write..write + replacement.len()].copy_from_slice(replacement);
+                write += replacement.len();
+                read = p + old_bytes;
+            }
+            raw.copy_within(read.., write);
+            data.truncate(new_len);
+        } else {
+            let raw = data.as_raw_slice();
+            let mut out = Vec::with_capacity(new_len.div_ceil(8));
+            let mut read = 0;
+            for &pos in starting_points {
+                out.extend_from_slice(&raw[read..pos / 8]);
+                out.extend_from_slice(replacement);
+                read = pos / 8 + old_bytes;
+            }
+            out.extend_from_slice(&raw[read..]);
+            let mut bv = BV::from_vec(out);
+            bv.truncate(new_len);
+            *data = bv;
+        }
+    }
+
     pub fn _set_from_sequence(&mut self, value: bool, indices: Vec<i64>) -> PyResult<()> {
+        let len = self.inner.len();
         for idx in indices {
-            let pos: usize = validate_index(idx, self.inner.len())?;
+            let pos: usize = validate_index(idx, len)?;
             self.inner.data.set(pos, value);
         }
         Ok(())
@@ -2,6 +2,7 @@
 use crate::tibs_::Tibs;
 use crate::core::BitCollection;
 use bitvec::prelude::*;
+use once_cell::sync::{Lazy, OnceCell};
 use pyo3::exceptions::{PyIndexError, PyValueError};
 use pyo3::PyResult;
 use rand::RngCore;
@@ -11,6 +12,43 @@ use sha2::Digest;
 pub type BV = BitVec<u8, Msb0>;
 pub type BS = BitSlice<u8, Msb0>;
 
+// The default x86-64 target stops at SSE2, so the hottest word loops are also built for AVX2 and
+// POPCNT and picked at runtime. The check is made once per process. Setting TIBS_SIMD=none in the
+// environment keeps to the portable builds, which is useful when debugging (see the README).
+#[cfg(target_arch = "x86_64")]
+static USE_AVX2: Lazy<bool> = Lazy::new(|| {
+    std::env::var("TIBS_SIMD").map_or(true, |v| v != "none")
+        && is_x86_feature_detected!("avx2")
+        && is_x86_feature_detected!("popcnt")
+});
+
+// PEXT and PDEP are single fast instructions on Intel and on AMD from Zen 3, but earlier AMD
+// CPUs run them as microcode taking hundreds of cycles, which is far slower than the portable
+// loops. They are only used where they are fast, which is checked once per process.
+#[cfg(target_arch = "x86_64")]
+static USE_BMI2: Lazy<bool> = Lazy::new(|| {
+    std::env::var("TIBS_SIMD").map_or(true, |v| v != "none")
+        && is_x86_feature_detected!("bmi2")
+        && !slow_bmi2()
+});
+
+/// Whether the CPU is an AMD (or Hygon) one from before Zen 3, with microcoded PEXT and PDEP.
+#[cfg(target_arch = "x86_64")]
+fn slow_bmi2() -> bool {
+    use std::arch::x86_64::__cpuid;
+    // SAFETY: every x86-64 CPU has CPUID.
+    let (vendor, signature) = unsafe { (__cpuid(0), __cpuid(1).eax) };
+    let mut name = [0u8; 12];
+    name[..4].copy_from_slice(&vendor.ebx.to_le_bytes());
+    name[4..8].copy_from_slice(&vendor.edx.to_le_bytes());
+    name[8..].copy_from_slice(&vendor.ecx.to_le_bytes());
+    let family = match (signature >> 8) & 0xf {
+        0xf => 0xf + ((signature >> 20) & 0xff),
+        base => base,
+    };
+    (&name == b"AuthenticAMD" || &name == b"HygonGenuine") && family < 0x19
+}
+
 // An implementation of the KMP algorithm for bit slices.
 fn compute_lps(pattern: &BS) -> Vec<usize> {
     let len = pattern.len();
@@ -41,14 +79,576 @@ pub(crate) fn find_bitvec(
     start: usize,
     end: usize,
     byte_aligned: bool,
+) -> Option<usize> {
+    let table = SearchTable::default();
+    find_bitvec_with_table(haystack, needle, start, end, byte_aligned, &table)
+}
+
+/// Tables built from a needle, kept so that searching repeatedly for the same needle doesn't
+/// rebuild them for every match.
+#[derive(Default)]
+pub(crate) struct SearchTable {
+    // KMP table, or empty if the needle is short enough not to need one.
+    lps: Vec<usize>,
+    // Byte pair skip table, built the first time a search uses it.
+    pair_shifts: OnceCell<Vec<u16>>,
+}
+
+/// The tables needed to search for `needle`, for passing to find_bitvec_with_table.
+pub(crate) fn search_table(needle: &Tibs) -> SearchTable {
+    SearchTable {
+        lps: if needle.len() > 64 {
+            compute_lps(&needle.data)
+        } else {
+            Vec::new()
+        },
+        pair_shifts: OnceCell::new(),
+    }
+}
+
+/// As find_bitvec, but using tables from search_table.
+pub(crate) fn find_bitvec_with_table(
+    haystack: &Tibs,
+    needle: &Tibs,
+    start: usize,
+    end: usize,
+    byte_aligned: bool,
+    table: &SearchTable,
 ) -> Option<usize> {
     debug_assert!(end >= start);
     debug_assert!(end <= haystack.len());
+    // Only byte boundaries can match, so start at the first one rather than testing the bits
+    // before it, and give up without searching if the needle can no longer fit.
+    let start = if byte_aligned { start.div_ceil(8) * 8 } else { start };
+    if end < start + needle.len() {
+        return None;
+    }
     if byte_aligned {
-        find_bitvec_impl::<true>(haystack, needle, start, end)
+        let found = find_aligned_bytes(&haystack.data, &needle.data, start, end, false, table);
+        if let Some(found) = found {
+            return found;
+        }
+    } else if needle.len() == 1 && start < end {
+        return first_bit(&haystack.data[start..end], needle.data[0]).map(|p| start + p);
+    }
+    if needle.len() <= 64 {
+        if byte_aligned {
+            find_short_impl::<true>(&haystack.data, &needle.data, start, end)
+        } else {
+            find_short_impl::<false>(&haystack.data, &needle.data, start, end)
+        }
+    } else if byte_aligned {
+        find_bitvec_impl::<true>(haystack, needle, start, end, &table.lps)
     } else {
-        find_bitvec_impl::<false>(haystack, needle, start, end)
+        find_bitvec_impl::<false>(haystack, needle, start, end, &table.lps)
+    }
+}
+
+/// The whole bytes of a bit slice that starts on a byte boundary.
+#[inline]
+fn whole_bytes(bits: &BS) -> Option<&[u8]> {
+    match bits.domain() {
+        bitvec::domain::Domain::Region { head: None, body, .. } => Some(body),
+        _ => None,
+    }
+}
+
+// Needles at least this long are searched with Horspool's skip table, whose skips by then beat
+// testing every position. Shorter needles use a filter on their two rarest bytes.
+const HORSPOOL_MIN_NEEDLE: usize = 32;
+// Needles at least this long, searched for in haystacks at least QGRAM_MIN_HAYSTACK long, key the
+// skip table on the last two bytes of the window rather than one. Pairs are much rarer than single
+// bytes, so the skips are longer, but the table is 128KB and has to be paid for by the search.
+const QGRAM_MIN_NEEDLE: usize = 256;
+const QGRAM_MIN_HAYSTACK: usize = 1 << 20;
+// Number of candidate positions tested together by the filter, which is one AVX2 register of
+// bytes. The portable build leaves the comparisons to the compiler to vectorise.
+const FILTER_BLOCK: usize = 32;
+
+#[inline]
+fn byte_pair(a: u8, b: u8) -> usize {
+    u16::from_be_bytes([a, b]) as usize
+}
+
+/// Skip table for find_bytes_qgram, indexed by byte_pair. Needs n >= 3.
+fn pair_shift_table(needle: &[u8]) -> Vec<u16> {
+    let n = needle.len();
+    // Each pair is shifted to its last occurrence in the needle before the final pair. Shorter
+    // shifts than allowed are always safe, so they can be capped to fit the table.
+    let longest = (n - 1).min(u16::MAX as usize) as u16;
+    let mut shift = vec![longest; 1 << 16];
+    for (j, w) in needle[..n - 1].windows(2).enumerate() {
+        shift[byte_pair(w[0], w[1])] = (n - 2 - j).min(u16::MAX as usize) as u16;
+    }
+    shift
+}
+
+/// Horspool search with the shift keyed on the byte pair ending the window, using the table from
+/// pair_shift_table.
+fn find_bytes_qgram(haystack: &[u8], needle: &[u8], shift: &[u16]) -> Option<usize> {
+    let n = needle.len();
+    let last = byte_pair(needle[n - 2], needle[n - 1]);
+    let mut i = 0;
+    while i + n <= haystack.len() {
+        let key = byte_pair(haystack[i + n - 2], haystack[i + n - 1]);
+        if key == last && haystack[i..i + n - 2] == needle[..n - 2] {
+            return Some(i);
+        }
+        i += shift[key] as usize;
     }
+    None
+}
+
+/// Horspool shift table from the needle's bytes given nearest-first, for a needle of length n.
+fn horspool_shifts<'a>(bytes: impl Iterator<Item = &'a u8>, n: usize) -> [usize; 256] {
+    let mut shift = [n; 256];
+    for (distance, &b) in bytes.enumerate() {
+        if shift[b as usize] == n {
+            shift[b as usize] = distance + 1;
+        }
+    }
+    shift
+}
+
+// Rough commonness of each byte value, higher meaning more common. Zero and all-ones bytes fill
+// much binary data, and after those come ASCII text and then control and high bytes.
+static BYTE_RANK: [u8; 256] = build_byte_rank();
+
+const fn build_byte_rank() -> [u8; 256] {
+    let mut table = [0u8; 256];
+    let mut b = 0;
+    while b < 256 {
+        table[b] = match b as u8 {
+            0x00 => 255,
+            0xff => 240,
+            b' ' => 200,
+            b'e' | b't' | b'a' | b'o' | b'i' | b'n' | b's' | b'r' | b'h' => 190,
+            b'a'..=b'z' => 170,
+            b'0'..=b'9' => 150,
+            b'A'..=b'Z' => 140,
+            b'\t' | b'\n' | b'\r' => 130,
+            0x21..=0x7e => 120,
+            0x01..=0x1f => 60,
+            _ => 40,
+        };
+        b += 1;
+    }
+    table
+}
+
+/// The offsets, in order, of the two bytes of a needle of at least two bytes that are least
+/// likely to turn up in the haystack. Filtering on these rejects more positions than filtering
+/// on the first and last bytes, which are often zero or padding.
+fn rare_offsets(needle: &[u8]) -> (usize, usize) {
+    debug_assert!(needle.len() >= 2);
+    let rank = |k: usize| BYTE_RANK[needle[k] as usize];
+    let rarest = (0..needle.len()).min_by_key(|&k| rank(k)).unwrap();
+    let next = (0..needle.len())
+        .filter(|&k| k != rarest)
+        .min_by_key(|&k| rank(k))
+        .unwrap();
+    (rarest.min(next), rarest.max(next))
+}
+
+/// Bit j is set if a needle starting at i + j has the right bytes at offsets a and b.
+#[inline]
+pub(crate) fn candidate_mask(
+    haystack: &[u8],
+    i: usize,
+    (a, b): (usize, usize),
+    (x, y): (u8, u8),
+) -> u32 {
+    let at_a: &[u8; FILTER_BLOCK] = haystack[i + a..i + a + FILTER_BLOCK].try_into().unwrap();
+    let at_b: &[u8; FILTER_BLOCK] = haystack[i + b..i + b + FILTER_BLOCK].try_into().unwrap();
+    let mut mask = 0u32;
+    for j in 0..FILTER_BLOCK {
+        mask |= (((at_a[j] == x) & (at_b[j] == y)) as u32) << j;
+    }
+    mask
+}
+
+/// As candidate_mask, with each set of comparisons done as one 32-byte AVX2 compare, and the two
+/// results combined and gathered into the mask with an AND and a movemask.
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2")]
+#[inline]
+pub(crate) unsafe fn candidate_mask_avx2(
+    haystack: &[u8],
+    i: usize,
+    (a, b): (usize, usize),
+    (x, y): (u8, u8),
+) -> u32 {
+    use std::arch::x86_64::*;
+    let at_a = &haystack[i + a..i + a + FILTER_BLOCK];
+    let at_b = &haystack[i + b..i + b + FILTER_BLOCK];
+    // SAFETY: both slices are FILTER_BLOCK (32) bytes long, and the loads are unaligned.
+    let va = _mm256_loadu_si256(at_a.as_ptr() as *const __m256i);
+    let vb = _mm256_loadu_si256(at_b.as_ptr() as *const __m256i);
+    let eq_a = _mm256_cmpeq_epi8(va, _mm256_set1_epi8(x as i8));
+    let eq_b = _mm256_cmpeq_epi8(vb, _mm256_set1_epi8(y as i8));
+    _mm256_movemask_epi8(_mm256_and_si256(eq_a, eq_b)) as u32
+}
+
+fn find_bytes(haystack: &[u8], needle: &[u8], pair_shifts: &OnceCell<Vec<u16>>) -> Option<usize> {
+    #[cfg(target_arch = "x86_64")]
+    if *USE_AVX2 {
+        // SAFETY: USE_AVX2 is only set when the CPU has the features enabled for this build.
+        return unsafe { find_bytes_avx2(haystack, needle, pair_shifts) };
+    }
+    find_bytes_portable(haystack, needle, pair_shifts)
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2,popcnt")]
+unsafe fn find_bytes_avx2(
+    haystack: &[u8],
+    needle: &[u8],
+    pair_shifts: &OnceCell<Vec<u16>>,
+) -> Option<usize> {
+    // SAFETY: this is only reached when the CPU has AVX2.
+    find_bytes_with(
+        haystack,
+        needle,
+        pair_shifts,
+        |h, i, offsets, bytes| unsafe { candidate_mask_avx2(h, i, offsets, bytes) },
+    )
+}
+
+#[inline(always)]
+fn find_bytes_portable(
+    haystack: &[u8],
+    needle: &[u8],
+    pair_shifts: &OnceCell<Vec<u16>>,
+) -> Option<usize> {
+    find_bytes_with(haystack, needle, pair_shifts, candidate_mask)
+}
+
+#[inline(always)]
+fn find_bytes_with(
+    haystack: &[u8],
+    needle: &[u8],
+    pair_shifts: &OnceCell<Vec<u16>>,
+    candidate_mask: impl Fn(&[u8], usize, (usize, usize), (u8, u8)) -> u32,
+) -> Option<usize> {
+    let n = needle.len();
+    if n > haystack.len() {
+        return None;
+    }
+    if n == 1 {
+        return haystack.iter().position(|&b| b == needle[0]);
+    }
+    if n >= QGRAM_MIN_NEEDLE && haystack.len() >= QGRAM_MIN_HAYSTACK {
+        let shift = pair_shifts.get_or_init(|| pair_shift_table(needle));
+        return find_bytes_qgram(haystack, needle, shift);
+    }
+    if n >= HORSPOOL_MIN_NEEDLE {
+        let shift = horspool_shifts(needle[..n - 1].iter().rev(), n);
+        let last = needle[n - 1];
+        let mut i = 0;
+        while i + n <= haystack.len() {
+            let b = haystack[i + n - 1];
+            if b == last && haystack[i..i + n - 1] == needle[..n - 1] {
+                return Some(i);
+            }
+            i += shift[b as usize];
+        }
+        return None;
+    }
+    let offsets = rare_offsets(needle);
+    let bytes = (needle[offsets.0], needle[offsets.1]);
+    let candidates = haystack.len() - n + 1;
+    let mut i = 0;
+    while i + FILTER_BLOCK <= candidates {
+        let mut mask = candidate_mask(haystack, i, offsets, bytes);
+        while mask != 0 {
+            let p = i + mask.trailing_zeros() as usize;
+            if haystack[p..p + n] == *needle {
+                return Some(p);
+            }
+            mask &= mask - 1;
+        }
+        i += FILTER_BLOCK;
+    }
+    (i..candidates).find(|&p| haystack[p..p + n] == *needle)
+}
+
+fn rfind_bytes(haystack: &[u8], needle: &[u8]) -> Option<usize> {
+    #[cfg(target_arch = "x86_64")]
+    if *USE_AVX2 {
+        // SAFETY: USE_AVX2 is only set when the CPU has the features enabled for this build.
+        return unsafe { rfind_bytes_avx2(haystack, needle) };
+    }
+    rfind_bytes_portable(haystack, needle)
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2,popcnt")]
+unsafe fn rfind_bytes_avx2(haystack: &[u8], needle: &[u8]) -> Option<usize> {
+    // SAFETY: this is only reached when the CPU has AVX2.
+    rfind_bytes_with(haystack, needle, |h, i, offsets, bytes| unsafe {
+        candidate_mask_avx2(h, i, offsets, bytes)
+    })
+}
+
+#[inline(always)]
+fn rfind_bytes_portable(haystack: &[u8], needle: &[u8]) -> Option<usize> {
+    rfind_bytes_with(haystack, needle, candidate_mask)
+}
+
+#[inline(always)]
+fn rfind_bytes_with(
+    haystack: &[u8],
+    needle: &[u8],
+    candidate_mask: impl Fn(&[u8], usize, (usize, usize), (u8, u8)) -> u32,
+) -> Option<usize> {
+    let n = needle.len();
+    if n > haystack.len() {
+        return None;
+    }
+    if n == 1 {
+        return haystack.iter().rposition(|&b| b == needle[0]);
+    }
+    if n >= HORSPOOL_MIN_NEEDLE {
+        // Mirror image of find_bytes, keyed on the byte under the start of the window.
+        let shift = horspool_shifts(needle[1..].iter(), n);
+        let first = needle[0];
+        let mut i = haystack.len() - n;
+        loop {
+            let b = haystack[i];
+            if b == first && haystack[i + 1..i + n] == needle[1..] {
+                return Some(i);
+            }
+            i = i.checked_sub(shift[b as usize])?;
+        }
+    }
+    let offsets = rare_offsets(needle);
+    let bytes = (needle[offsets.0], needle[offsets.1]);
+    let mut end = haystack.len() - n + 1;
+    while end >= FILTER_BLOCK {
+        let i = end - FILTER_BLOCK;
+        let mut mask = candidate_mask(haystack, i, offsets, bytes);
+        while mask != 0 {
+            let j = 31 - mask.leading_zeros() as usize;
+            if haystack[i + j..i + j + n] == *needle {
+                return Some(i + j);
+            }
+            mask &= !(1 << j);
+        }
+        end = i;
+    }
+    (0..end).rev().find(|&p| haystack[p..p + n] == *needle)
+}
+
+/// Byte-aligned search done as a plain byte search, for when both the haystack and a whole-byte needle
+/// start on byte boundaries.
+///
+/// Returns None if the fast path doesn't apply, otherwise the result of the search. Forward searches
+/// keep any table they build in `table`, for the next search for the same needle.
+pub(crate) fn find_aligned_bytes(
+    haystack: &BS,
+    needle: &BS,
+    start: usize,
+    end: usize,
+    reverse: bool,
+    table: &SearchTable,
+) -> Option<Option<usize>> {
+    if needle.is_empty() || needle.len() % 8 != 0 {
+        return None;
+    }
+    let hay = whole_bytes(haystack)?;
+    let pattern = whole_bytes(needle)?;
+    let first = start.div_ceil(8);
+    let last = end / 8;
+    if last < first + pattern.len() {
+        return Some(None);
+    }
+    let window = &hay[first..last];
+    let found = if reverse {
+        rfind_bytes(window, pattern)
+    } else {
+        find_bytes(window, pattern, &table.pair_shifts)
+    };
+    Some(found.map(|p| (first + p) * 8))
+}
+
+/// Bits [pos, pos + 64) of the slice as a left-justified u64, zero padded at or beyond `end`.
+#[inline]
+fn load_window(bits: &BS, pos: usize, end: usize) -> u64 {
+    if pos >= end {
+        return 0;
+    }
+    let stop = std::cmp::min(pos + 64, end);
+    bits[pos..stop].load_be::<u64>() << (64 - (stop - pos))
+}
+
+// Search for needles of up to 64 bits. Two words are loaded per block of 64 candidate offsets and
+// the offsets are all tested together: bit 63 - j of `matches` tracks whether a match can still start
+// at block + j, and each needle bit clears the offsets whose haystack bit disagrees with it. This is
+// one shift and AND per needle bit per block, and random data usually clears every candidate after a
+// handful of needle bits.
+#[inline]
+fn block_matches<const BYTE_ALIGNED: bool>(
+    haystack: &BS,
+    pattern: u64,
+    needle_len: usize,
+    block: usize,
+    count: usize,
+    end: usize,
+) -> u64 {
+    debug_assert!(count >= 1 && count <= 64);
+    let hi = load_window(haystack, block, end);
+    let lo = load_window(haystack, block + 64, end);
+    let mut matches = !0u64 << (64 - count);
+    if BYTE_ALIGNED {
+        matches &= 0x8080_8080_8080_8080u64 >> ((8 - block % 8) % 8);
+    }
+    for k in 0..needle_len {
+        let window = if k == 0 { hi } else { (hi << k) | (lo >> (64 - k)) };
+        matches &= if (pattern << k) >> 63 == 1 { window } else { !window };
+        if matches == 0 {
+            break;
+        }
+    }
+    matches
+}
+
+#[inline]
+fn find_short_impl<const BYTE_ALIGNED: bool>(
+    haystack: &BS,
+    needle: &BS,
+    start: usize,
+    end: usize,
+) -> Option<usize> {
+    let needle_len = needle.len();
+    debug_assert!(needle_len <= 64);
+    if needle_len == 0 || end < start + needle_len {
+        return None;
+    }
+    let last = end - needle_len;
+    let pattern = needle.load_be::<u64>() << (64 - needle_len);
+    let mut block = start;
+    while block <= last {
+        let count = std::cmp::min(64, last - block + 1);
+        let matches =
+            block_matches::<BYTE_ALIGNED>(haystack, pattern, needle_len, block, count, end);
+        if matches != 0 {
+            return Some(block + matches.leading_zeros() as usize);
+        }
+        block += 64;
+    }
+    None
+}
+
+/// The mirror image of find_short_impl, working down from the end and taking the last match in
+/// each block.
+#[inline]
+fn rfind_short_impl<const BYTE_ALIGNED: bool>(
+    haystack: &BS,
+    needle: &BS,
+    start: usize,
+    end: usize,
+) -> Option<usize> {
+    let needle_len = needle.len();
+    debug_assert!(needle_len <= 64);
+    if needle_len == 0 || end < start + needle_len {
+        return None;
+    }
+    let pattern = needle.load_be::<u64>() << (64 - needle_len);
+    // One past the last candidate offset still to be tested.
+    let mut top = end - needle_len + 1;
+    while top > start {
+        let block = std::cmp::max(start, top.saturating_sub(64));
+        let matches =
+            block_matches::<BYTE_ALIGNED>(haystack, pattern, needle_len, block, top - block, end);
+        if matches != 0 {
+            return Some(block + 63 - matches.trailing_zeros() as usize);
+        }
+        top = block;
+    }
+    None
+}
+
+/// Return the position of the last occurrence of `needle` that lies within [start, end) of the
+/// haystack, or None if there isn't one.
+pub(crate) fn rfind_bitvec(
+    haystack: &BS,
+    needle: &BS,
+    start: usize,
+    end: usize,
+    byte_aligned: bool,
+) -> Option<usize> {
+    debug_assert!(end >= start);
+    debug_assert!(end <= haystack.len());
+    let n = needle.len();
+    if n == 0 || end < start + n {
+        return None;
+    }
+    if byte_aligned {
+        let found = find_aligned_bytes(haystack, needle, start, end, true, &SearchTable::default());
+        if let Some(found) = found {
+            return found;
+        }
+    }
+    if n <= 64 {
+        return if byte_aligned {
+            rfind_short_impl::<true>(haystack, needle, start, end)
+        } else {
+            rfind_short_impl::<false>(haystack, needle, start, end)
+        };
+    }
+    let step = if byte_aligned { 8 } else { 1 };
+    let mut pos = end - n;
+    if byte_aligned {
+        pos = pos / 8 * 8;
+    }
+    while pos >= start {
+        if haystack[pos..pos + n] == *needle {
+            return Some(pos);
+        }
+        if pos < step {
+            break;
+        }
+        pos -= step;
+    }
+    None
+}
+
+/// Whether each needle occurs anywhere in the haystack. Needles of up to 64 bits are all tested
+/// in a single pass, sharing each window loaded from the haystack; longer ones are searched for
+/// individually. Empty needles are never found.
+pub(crate) fn contains_each(haystack: &Tibs, needles: &[Tibs]) -> Vec<bool> {
+    let end = haystack.len();
+    let mut found: Vec<bool> = needles
+        .iter()
+        .map(|n| n.len() > 64 && find_bitvec(haystack, n, 0, end, false).is_some())
+        .collect();
+    // (index, pattern, mask, length) for the short needles that could fit.
+    let short: Vec<(usize, u64, u64, usize)> = needles
+        .iter()
+        .enumerate()
+        .filter(|(_, n)| !n.is_empty() && n.len() <= 64 && n.len() <= end)
+        .map(|(k, n)| {
+            let len = n.len();
+            (k, n.data.load_be::<u64>() << (64 - len), !0u64 << (64 - len), len)
+        })
+        .collect();
+    let mut remaining = short.len();
+    let mut block = 0;
+    while block < end && remaining > 0 {
+        let hi = load_window(&haystack.data, block, end);
+        let lo = load_window(&haystack.data, block + 64, end);
+        for i in 0..std::cmp::min(64, end - block) {
+            let window = if i == 0 { hi } else { (hi << i) | (lo >> (64 - i)) };
+            for &(k, pattern, mask, len) in &short {
+                if !found[k] && block + i + len <= end && (window ^ pattern) & mask == 0 {
+                    found[k] = true;
+                    remaining -= 1;
+                }
+            }
+        }
+        block += 64;
+    }
+    found
 }
 
 #[inline]
@@ -57,12 +657,19 @@ fn find_bitvec_impl<const BYTE_ALIGNED: bool>(
     needle: &Tibs,
     start: usize,
     end: usize,
+    table: &[usize],
 ) -> Option<usize> {
     if needle.len() == 0 || needle.len() > haystack.len() - start {
         return None;
     }
 
-    let lps = compute_lps(&needle.data);
+    let computed;
+    let lps = if table.is_empty() {
+        computed = compute_lps(&needle.data);
+        &computed
+    } else {
+        table
+    };
     let needle_len = needle.len();
     let mut i = start;
     let mut j = 0;
@@ -89,35 +696,385 @@ fn find_bitvec_impl<const BYTE_ALIGNED: bool>(
     None
 }
 
-pub(crate) fn validate_index(index: i64, length: usize) -> PyResult<usize> {
-    let index_p = if index < 0 {
-        length as i64 + index
-    } else {
-        index
+/// Count the set bits, a u64 at a time over the whole bytes and masking any partial bytes at either end.
+pub(crate) fn count_ones(bits: &BS) -> usize {
+    match bits.domain() {
+        bitvec::domain::Domain::Enclosed(elem) => elem.load_value().count_ones() as usize,
+        bitvec::domain::Domain::Region { head, body, tail } => {
+            let partial = head.map_or(0, |elem| elem.load_value().count_ones())
+                + tail.map_or(0, |elem| elem.load_value().count_ones());
+            count_ones_bytes(body) + partial as usize
+        }
+    }
+}
+
+fn count_ones_bytes(bytes: &[u8]) -> usize {
+    #[cfg(target_arch = "x86_64")]
+    if *USE_AVX2 {
+        // SAFETY: USE_AVX2 is only set when the CPU has the features enabled for this build.
+        return unsafe { count_ones_bytes_avx2(bytes) };
+    }
+    count_ones_bytes_portable(bytes)
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2,popcnt")]
+unsafe fn count_ones_bytes_avx2(bytes: &[u8]) -> usize {
+    count_ones_bytes_portable(bytes)
+}
+
+#[inline(always)]
+fn count_ones_bytes_portable(bytes: &[u8]) -> usize {
+    let words = bytes.chunks_exact(8);
+    let rest: u32 = words.remainder().iter().map(|b| b.count_ones()).sum();
+    let whole: usize = words
+        .map(|w| u64::from_ne_bytes(w.try_into().unwrap()).count_ones() as usize)
+        .sum();
+    whole + rest as usize
+}
+
+/// Position of the first bit equal to `value`. The whole bytes are scanned a u64 at a time, with
+/// bits equal to `value` turned into set bits so that a leading zero count finds them.
+pub(crate) fn first_bit(bits: &BS, value: bool) -> Option<usize> {
+    let flip = if value { 0 } else { !0u64 };
+    let in_byte = |v: u8, mask: u8| {
+        let m = (v ^ flip as u8) & mask;
+        (m != 0).then(|| m.leading_zeros() as usize)
     };
-    if index_p >= length as i64 || index_p < 0 {
+    match bits.domain() {
+        bitvec::domain::Domain::Enclosed(elem) => {
+            in_byte(elem.load_value(), elem.mask().into_inner())
+                .map(|p| p - elem.head().into_inner() as usize)
+        }
+        bitvec::domain::Domain::Region { head, body, tail } => {
+            let mut offset = 0;
+            if let Some(elem) = head {
+                let first = elem.head().into_inner() as usize;
+                if let Some(p) = in_byte(elem.load_value(), elem.mask().into_inner()) {
+                    return Some(p - first);
+                }
+                offset = 8 - first;
+            }
+            let mut words = body.chunks_exact(8);
+            for w in &mut words {
+                let v = u64::from_be_bytes(w.try_into().unwrap()) ^ flip;
+                if v != 0 {
+                    return Some(offset + v.leading_zeros() as usize);
+                }
+                offset += 64;
+            }
+            for &b in words.remainder() {
+                if let Some(p) = in_byte(b, 0xff) {
+                    return Some(offset + p);
+                }
+                offset += 8;
+            }
+            tail.and_then(|elem| in_byte(elem.load_value(), elem.mask().into_inner()))
+                .map(|p| offset + p)
+        }
+    }
+}
+
+/// Mask for the bits of the final byte that are in use for a length of `len` bits, where all
+/// eight bits are in use when `len` is a multiple of 8. This is computed without a branch.
+#[inline]
+pub(crate) fn last_byte_mask(len: usize) -> u8 {
+    (0xff00u16 >> ((len + 7) % 8 + 1)) as u8
+}
+
+/// Bit-wise equality. When both start at the front of their first byte the bytes are compared as
+/// plain byte slices (a memcmp), with only the bits in use in the final byte compared. This is
+/// safe for a Mutibs, whose final byte can hold junk.
+pub(crate) fn eq_bits(a: &BV, b: &BV) -> bool {
+    if a.len() != b.len() {
+        return false;
+    }
+    if a.as_bitptr().bit().into_inner() != 0 || b.as_bitptr().bit().into_inner() != 0 {
+        return a == b;
+    }
+    match (a.as_raw_slice().split_last(), b.as_raw_slice().split_last()) {
+        (Some((a_last, a_rest)), Some((b_last, b_rest))) => {
+            a_rest == b_rest && (a_last ^ b_last) & last_byte_mask(a.len()) == 0
+        }
+        _ => true,
+    }
+}
+
+/// Whether `pattern` occurs in `bits` at bit position `start`, for use by prefix and suffix
+/// checks. When both the pattern and the position in `bits` are on byte boundaries this is a
+/// memcmp of the whole bytes and a masked compare of any final partial byte.
+pub(crate) fn matches_at(bits: &BV, start: usize, pattern: &BV) -> bool {
+    let n = pattern.len();
+    if start + n > bits.len() {
+        return false;
+    }
+    if start % 8 != 0
+        || bits.as_bitptr().bit().into_inner() != 0
+        || pattern.as_bitptr().bit().into_inner() != 0
+    {
+        return bits[start..start + n] == pattern[..];
+    }
+    let bytes = &bits.as_raw_slice()[start / 8..];
+    let pattern_bytes = pattern.as_raw_slice();
+    let whole = n / 8;
+    bytes[..whole] == pattern_bytes[..whole]
+        && (n % 8 == 0 || (bytes[whole] ^ pattern_bytes[whole]) & last_byte_mask(n) == 0)
+}
+
+/// Append `src_len` bits held in `src` to the `out_len` bits held in `out`. Both buffers must
+/// start at bit 0 and have any unused bits of their final byte zeroed, which is kept true for
+/// `out`. When `out` doesn't end on a byte boundary each source byte is split across two bytes.
+pub(crate) fn append_bits(out: &mut Vec<u8>, out_len: usize, src: &[u8], src_len: usize) {
+    let shift = out_len % 8;
+    if shift == 0 {
+        out.extend_from_slice(src);
+    } else if let Some((&last, _)) = src.split_last() {
+        *out.last_mut().unwrap() |= src[0] >> shift;
+        out.extend(src.windows(2).map(|w| (w[0] << (8 - shift)) | (w[1] >> shift)));
+        out.push(last << (8 - shift));
+    }
+    out.truncate((out_len + src_len).div_ceil(8));
+}
+
+/// Overwrite the bits of `dst` from `start` onwards with `src`.
+///
+/// When `src` starts on a byte boundary the copy is done on the raw bytes, with each source byte
+/// shifted into the two destination bytes it straddles, and only the first and last bytes merged
+/// under a mask. Otherwise this falls back to bitvec's copy.
+pub(crate) fn write_bits(dst: &mut BV, start: usize, src: &BS) {
+    debug_assert!(start + src.len() <= dst.len());
+    let (body, tail) = match src.domain() {
+        bitvec::domain::Domain::Region {
+            head: None,
+            body,
+            tail,
+        } => (body, tail.map(|elem| elem.load_value())),
+        _ => {
+            dst[start..start + src.len()].copy_from_bitslice(src);
+            return;
+        }
+    };
+    dst.force_align();
+    let raw = dst.as_raw_mut_slice();
+    write_raw_bits(raw, start, body, body.len() * 8);
+    if let Some(partial) = tail {
+        write_raw_bits(raw, start + body.len() * 8, &[partial], src.len() % 8);
+    }
+}
+
+/// Overwrite `n` bits of `dst` from bit `start` with the first `n` bits of `src`.
+fn write_raw_bits(dst: &mut [u8], start: usize, src: &[u8], n: usize) {
+    if n == 0 {
+        return;
+    }
+    let off = start % 8;
+    let first = start / 8;
+    let last = (start + n - 1) / 8;
+    let src_byte = |k: usize| src.get(k).copied().unwrap_or(0);
+    // The source bits that land in destination byte j.
+    let shifted = |j: usize| {
+        let k = j - first;
+        if off == 0 {
+            src_byte(k)
+        } else {
+            (if k == 0 { 0 } else { src_byte(k - 1) << (8 - off) }) | (src_byte(k) >> off)
+        }
+    };
+    let head_mask = 0xffu8 >> off;
+    let tail_mask = last_byte_mask(start + n);
+    if first == last {
+        let mask = head_mask & tail_mask;
+        dst[first] = (dst[first] & !mask) | (shifted(first) & mask);
+        return;
+    }
+    dst[first] = (dst[first] & !head_mask) | (shifted(first) & head_mask);
+    if off == 0 {
+        dst[first + 1..last].copy_from_slice(&src[1..last - first]);
+    } else {
+        for (d, w) in dst[first + 1..last].iter_mut().zip(src.windows(2)) {
+            *d = (w[0] << (8 - off)) | (w[1] >> off);
+        }
+    }
+    dst[last] = (dst[last] & !tail_mask) | (shifted(last) & tail_mask);
+}
+
+/// Pack one bit per input byte, with any non-zero byte giving a set bit.
+pub(crate) fn pack_bools(values: &[u8]) -> BV {
+    let packed: Vec<u8> = values
+        .chunks(8)
+        .map(|chunk| {
+            chunk
+                .iter()
+                .enumerate()
+                .fold(0u8, |acc, (i, &v)| acc | (((v != 0) as u8) << (7 - i)))
+        })
+        .collect();
+    let mut bv = BV::from_vec(packed);
+    bv.truncate(values.len());
+    bv
+}
+
+/// Combine `src` into `dst` with a bit-wise operation. The bytes are handled eight at a time as
+/// `u64` words in a flat loop, which the compiler turns into vector instructions.
+pub(crate) fn combine_words(dst: &mut [u8], src: &[u8], op: impl Fn(u64, u64) -> u64) {
+    #[cfg(target_arch = "x86_64")]
+    if *USE_AVX2 {
+        // SAFETY: USE_AVX2 is only set when the CPU has the features enabled for this build.
+        return unsafe { combine_words_avx2(dst, src, op) };
+    }
+    combine_words_portable(dst, src, op)
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2,popcnt")]
+unsafe fn combine_words_avx2(dst: &mut [u8], src: &[u8], op: impl Fn(u64, u64) -> u64) {
+    combine_words_portable(dst, src, op)
+}
+
+#[inline(always)]
+fn combine_words_portable(dst: &mut [u8], src: &[u8], op: impl Fn(u64, u64) -> u64) {
+    debug_assert_eq!(dst.len(), src.len());
+    let mut dst_words = dst.chunks_exact_mut(8);
+    let mut src_words = src.chunks_exact(8);
+    for (d, s) in (&mut dst_words).zip(&mut src_words) {
+        let value = op(
+            u64::from_ne_bytes(d.try_into().unwrap()),
+            u64::from_ne_bytes(s.try_into().unwrap()),
+        );
+        d.copy_from_slice(&value.to_ne_bytes());
+    }
+    for (d, s) in dst_words.into_remainder().iter_mut().zip(src_words.remainder()) {
+        *d = op(*d as u64, *s as u64) as u8;
+    }
+}
+
+/// Invert every bit of `dst`, a word at a time.
+pub(crate) fn invert_words(dst: &mut [u8]) {
+    #[cfg(target_arch = "x86_64")]
+    if *USE_AVX2 {
+        // SAFETY: USE_AVX2 is only set when the CPU has the features enabled for this build.
+        return unsafe { invert_words_avx2(dst) };
+    }
+    invert_words_portable(dst)
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2,popcnt")]
+unsafe fn invert_words_avx2(dst: &mut [u8]) {
+    invert_words_portable(dst)
+}
+
+#[inline(always)]
+fn invert_words_portable(dst: &mut [u8]) {
+    let mut words = dst.chunks_exact_mut(8);
+    for d in &mut words {
+        let value = !u64::from_ne_bytes((&*d).try_into().unwrap());
+        d.copy_from_slice(&value.to_ne_bytes());
+    }
+    for d in words.into_remainder() {
+        *d = !*d;
+    }
+}
+
+/// Reverse the order of the bytes within each `group` bytes of `bytes`, whose length must be a
+/// multiple of `group`. The common group sizes are done as fixed-size swaps, which compile to byte
+/// swaps of whole registers (and to shuffles when AVX2 is available).
+pub(crate) fn swap_byte_groups(bytes: &mut [u8], group: usize) {
+    #[cfg(target_arch = "x86_64")]
+    if *USE_AVX2 {
+        // SAFETY: USE_AVX2 is only set when the CPU has the features enabled for this build.
+        return unsafe { swap_byte_groups_avx2(bytes, group) };
+    }
+    swap_byte_groups_portable(bytes, group)
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2,popcnt")]
+unsafe fn swap_byte_groups_avx2(bytes: &mut [u8], group: usize) {
+    swap_byte_groups_portable(bytes, group)
+}
+
+#[inline(always)]
+fn swap_byte_groups_portable(bytes: &mut [u8], group: usize) {
+    debug_assert!(group > 0 && bytes.len() % group == 0);
+    match group {
+        1 => {}
+        2 => reverse_chunks::<2>(bytes),
+        4 => reverse_chunks::<4>(bytes),
+        8 => reverse_chunks::<8>(bytes),
+        16 => reverse_chunks::<16>(bytes),
+        _ => bytes
+            .chunks_exact_mut(group)
+            .for_each(|chunk| chunk.reverse()),
+    }
+}
+
+#[inline(always)]
+fn reverse_chunks<const N: usize>(bytes: &mut [u8]) {
+    for chunk in bytes.chunks_exact_mut(N) {
+        let mut swapped: [u8; N] = (&*chunk).try_into().unwrap();
+        swapped.reverse();
+        chunk.copy_from_slice(&swapped);
+    }
+}
+
+/// Reverse the order of the bits in place. The bytes are reversed and each has its bits
+/// reversed, then if the length isn't a whole number of bytes the result is shifted up to
+/// drop the unused bits that have ended up at the front.
+pub(crate) fn reverse_bits(bits: &mut BV) {
+    let len = bits.len();
+    bits.force_align();
+    let raw = bits.as_raw_mut_slice();
+    raw.reverse();
+    for byte in raw.iter_mut() {
+        *byte = byte.reverse_bits();
+    }
+    let pad = (8 - len % 8) % 8;
+    if pad != 0 {
+        for i in 1..raw.len() {
+            raw[i - 1] = (raw[i - 1] << pad) | (raw[i] >> (8 - pad));
+        }
+        if let Some(last) = raw.last_mut() {
+            *last <<= pad;
+        }
+    }
+}
+
+#[inline]
+pub(crate) fn validate_index(index: i64, length: usize) -> PyResult<usize> {
+    // Adding the length moves every valid index, negative or not, into [0, 2 * length) and every
+    // invalid one outside it, so a single unsigned compare checks both ends. The index to use is
+    // then picked without a branch.
+    let shifted = index.wrapping_add(length as i64) as u64;
+    if shifted >= 2 * length as u64 {
         return Err(PyIndexError::new_err(format!(
             "Index of {index} is out of range for length of {length}"
         )));
     }
-    Ok(index_p as usize)
+    let position = if index < 0 { shifted } else { index as u64 };
+    Ok(position as usize)
 }
 
+#[inline]
 pub(crate) fn validate_slice(
     length: usize,
     start: Option<i64>,
     end: Option<i64>,
 ) -> PyResult<(usize, usize)> {
-    let mut start = start.unwrap_or(0);
-    let mut end = end.unwrap_or(length as i64);
-    if start < 0 {
-        start += length as i64;
-    }
-    if end < 0 {
-        end += length as i64;
+    // The usual case of no slice needs no checks.
+    if start.is_none() && end.is_none() {
+        return Ok((0, length));
     }
+    // Negative positions count back from the end. The sign bit, spread across the word by the
+    // arithmetic shift, masks the length so it's only added to those, without a branch.
+    let len = length as i64;
+    let start = start.unwrap_or(0);
+    let start = start + (len & (start >> 63));
+    let end = end.unwrap_or(len);
+    let end = end + (len & (end >> 63));
 
-    if !(0 <= start && start <= end && end <= length as i64) {
+    // Anything still negative is huge as a u64, so two unsigned compares check all the bounds.
+    if !(start as u64 <= end as u64 && end as u64 <= length as u64) {
         return Err(PyValueError::new_err(format!(
             "Invalid slice positions for Mutibs of length {length}: start={start}, end={end}."
         )));
@@ -125,6 +1082,208 @@ pub(crate) fn validate_slice(
     Ok((start as usize, end as usize))
 }
 
+/// Normalise an extended slice (as returned by Python's `slice.indices`) into ascending order.
+///
+/// Returns the lowest position, the number of positions and the positive stride,
+/// or None if the slice is empty.
+pub(crate) fn normalize_extended_slice(
+    start: i64,
+    stop: i64,
+    step: i64,
+) -> Option<(usize, usize, usize)> {
+    debug_assert!(step != 0);
+    if step > 0 {
+        if start >= stop {
+            return None;
+        }
+        let count = ((stop - start - 1) / step + 1) as usize;
+        Some((start as usize, count, step as usize))
+    } else {
+        if start <= stop {
+            return None;
+        }
+        let count = ((start - stop - 1) / -step + 1) as usize;
+        let first = start + step * (count as i64 - 1);
+        Some((first as usize, count, -step as usize))
+    }
+}
+
+// Portable version of the BMI2 PEXT instruction (Hacker's Delight 7-4).
+#[inline]
+fn pext_portable(value: u64, mut mask: u64) -> u64 {
+    let mut result = 0u64;
+    let mut bit = 1u64;
+    while mask != 0 {
+        let lowest = mask & mask.wrapping_neg();
+        if value & lowest != 0 {
+            result |= bit;
+        }
+        bit <<= 1;
+        mask ^= lowest;
+    }
+    result
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "bmi2")]
+unsafe fn pext_bmi2(value: u64, mask: u64) -> u64 {
+    std::arch::x86_64::_pext_u64(value, mask)
+}
+
+/// Gather the bits of `value` selected by `mask` into the low bits of the result.
+#[inline]
+pub(crate) fn pext_u64(value: u64, mask: u64) -> u64 {
+    #[cfg(target_arch = "x86_64")]
+    if *USE_BMI2 {
+        // SAFETY: USE_BMI2 is only set when the CPU has BMI2.
+        return unsafe { pext_bmi2(value, mask) };
+    }
+    pext_portable(value, mask)
+}
+
+// Portable version of the BMI2 PDEP instruction (Hacker's Delight 7-5).
+#[inline]
+fn pdep_portable(value: u64, mut mask: u64) -> u64 {
+    let mut result = 0u64;
+    let mut bit = 1u64;
+    while mask != 0 {
+        let lowest = mask & mask.wrapping_neg();
+        if value & bit != 0 {
+            result |= lowest;
+        }
+        bit <<= 1;
+        mask ^= lowest;
+    }
+    result
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "bmi2")]
+unsafe fn pdep_bmi2(value: u64, mask: u64) -> u64 {
+    std::arch::x86_64::_pdep_u64(value, mask)
+}
+
+/// Scatter the low bits of `value` into the positions selected by `mask`.
+#[inline]
+pub(crate) fn pdep_u64(value: u64, mask: u64) -> u64 {
+    #[cfg(target_arch = "x86_64")]
+    if *USE_BMI2 {
+        // SAFETY: USE_BMI2 is only set when the CPU has BMI2.
+        return unsafe { pdep_bmi2(value, mask) };
+    }
+    pdep_portable(value, mask)
+}
+
+/// Return a copy of `bits` with `count` bits removed, starting at `first` and every `step` bits after.
+///
+/// The surviving bits are packed 64 at a time with a PEXT compress rather than removed one by one.
+pub(crate) fn delete_stride(bits: &BS, first: usize, count: usize, step: usize) -> BV {
+    debug_assert!(count > 0 && step > 0);
+    let last = first + (count - 1) * step;
+    debug_assert!(last < bits.len());
+    let mut result = BV::with_capacity(bits.len() - count);
+    result.extend_from_bitslice(&bits[..first]);
+    if step == 1 {
+        result.extend_from_bitslice(&bits[last + 1..]);
+        return result;
+    }
+    let mut offset = 0;
+    for chunk in bits[first..=last].chunks(64) {
+        let n = chunk.len();
+        // Left-justify the chunk, then clear the mask bits for each position being deleted.
+        let word = chunk.load_be::<u64>() << (64 - n);
+        let mut mask = !0u64 << (64 - n);
+        let mut i = (step - offset % step) % step;
+        while i < n {
+            mask &= !(1u64 << (63 - i));
+            i += step;
+        }
+        let kept = mask.count_ones() as usize;
+        if kept != 0 {
+            let packed = pext_u64(word, mask).to_be_bytes();
+            result.extend_from_bitslice(&packed.view_bits::<Msb0>()[64 - kept..]);
+        }
+        offset += n;
+    }
+    result.extend_from_bitslice(&bits[last + 1..]);
+    result
+}
+
+/// Write `values` into `bits` at `first` and every `step` bits after.
+///
+/// The values are scattered 64 target bits at a time with a PDEP deposit rather than set one by one.
+pub(crate) fn set_stride(bits: &mut BS, first: usize, step: usize, values: &BS) {
+    debug_assert!(step > 0);
+    let count = values.len();
+    if count == 0 {
+        return;
+    }
+    let last = first + (count - 1) * step;
+    debug_assert!(last < bits.len());
+    if step == 1 {
+        bits[first..=last].copy_from_bitslice(values);
+        return;
+    }
+    if step >= 64 {
+        // At most one target per word, so there's nothing to gain from a deposit.
+        for (k, v) in values.iter().by_vals().enumerate() {
+            bits.set(first + k * step, v);
+        }
+        return;
+    }
+    let mut pos = first;
+    let mut taken = 0;
+    while pos <= last {
+        let n = std::cmp::min(64, last + 1 - pos);
+        // Left-justify the chunk and build a mask of the positions being written.
+        let mut mask = 0u64;
+        let mut i = (step - (pos - first) % step) % step;
+        while i < n {
+            mask |= 1u64 << (63 - i);
+            i += step;
+        }
+        let k = mask.count_ones() as usize;
+        let chunk = &mut bits[pos..pos + n];
+        let word = chunk.load_be::<u64>() << (64 - n);
+        let src = values[taken..taken + k].load_be::<u64>();
+        chunk.store_be(((word & !mask) | pdep_u64(src, mask)) >> (64 - n));
+        taken += k;
+        pos += n;
+    }
+}
+
+/// Rotate `bits` left by `n` places, where `n` < `bits.len()`.
+///
+/// This is done in place on the slice, so a rotate of part of a Mutibs doesn't copy the rest.
+/// Anything that fits in a u64 is rotated as a single word instead of through bitvec's generic rotate.
+/// The word rotate needs no special case for `n == 0`: the right shift by `len - n` is then either
+/// all of a shorter word, giving zero, or wraps round to a shift of zero for a full 64 bits.
+pub(crate) fn rotate_left(bits: &mut BS, n: usize) {
+    let len = bits.len();
+    debug_assert!(n < len || len == 0);
+    if len == 0 {
+        return;
+    }
+    if len > 64 {
+        // bitvec's rotate moves the whole slice along once per word of the rotation. Instead
+        // save the shorter of the two parts, move the longer one along just once, and put the
+        // saved part back at the other end.
+        if n <= len - n {
+            let saved = bits[..n].to_bitvec();
+            bits.copy_within(n.., 0);
+            bits[len - n..].copy_from_bitslice(&saved);
+        } else {
+            let saved = bits[n..].to_bitvec();
+            bits.copy_within(..n, len - n);
+            bits[..len - n].copy_from_bitslice(&saved);
+        }
+        return;
+    }
+    let word = bits.load_be::<u64>();
+    let rotated = (word << n) | word.wrapping_shr((len - n) as u32);
+    bits.store_be(rotated & (!0u64 >> (64 - len)));
+}
+
 pub(crate) fn process_seed(seed: Option<Vec<u8>>) -> [u8; 32] {
     match seed {
         None => {
@@ -3,8 +3,9 @@ use crate::helpers;
 use crate::tibs_::Tibs;
 use pyo3::prelude::*;
 use pyo3::PyResult;
+use std::collections::VecDeque;
 
-#[pyclass]
+#[pyclass(module = "tibs")]
 pub struct BoolIterator {
     pub(crate) bits: Py<Tibs>,
     pub(crate) index: usize,
@@ -29,7 +30,10 @@ impl BoolIterator {
     }
 }
 
-#[pyclass]
+// The most matches found in one go by FindAllIterator.
+const MAX_FIND_BATCH: usize = 1024;
+
+#[pyclass(module = "tibs")]
 pub struct FindAllIterator {
     pub haystack: Py<Tibs>, // Py<T> keeps the Python object alive
     pub needle: Py<Tibs>,
@@ -38,6 +42,10 @@ pub struct FindAllIterator {
     pub byte_aligned: bool,
     pub step: usize,
     pub current_pos: usize,
+    // From helpers::search_table, so it isn't rebuilt for every match
+    pub(crate) table: helpers::SearchTable,
+    pub pending: VecDeque<usize>, // Matches already found but not yet returned
+    pub batch: usize,             // How many matches to look for when pending runs out
 }
 
 #[pymethods]
@@ -47,18 +55,16 @@ impl FindAllIterator {
     }
 
     fn __next__(mut slf: PyRefMut<'_, Self>) -> PyResult<Option<usize>> {
+        if let Some(pos) = slf.pending.pop_front() {
+            return Ok(Some(pos));
+        }
         let py = slf.py();
 
-        // Read values from slf that are needed for the find logic
-        // or for updating state *after* the find.
-        let current_pos = slf.current_pos;
-        let byte_aligned = slf.byte_aligned;
-        let step = slf.step; // Needed to update slf.current_pos later
-
-        // This block limits the scope of haystack_rs and needle_rs.
-        // The immutable borrows of slf (to access slf.haystack and slf.needle)
-        // will end when this block finishes.
-        let find_result = {
+        // Matches are searched for in batches, so that the objects are borrowed and the search
+        // set up once per batch rather than once per match. The batch size doubles each time, so
+        // a caller that only wants the first few matches doesn't pay for a long search.
+        let batch = slf.batch;
+        let (found, next_pos) = {
             let haystack_rs = slf.haystack.borrow(py);
             let needle_rs = slf.needle.borrow(py);
 
@@ -68,26 +74,110 @@ impl FindAllIterator {
                 return Ok(None);
             }
 
-            let haystack_len = haystack_rs.len();
-            if current_pos >= haystack_len || haystack_len.saturating_sub(current_pos) < needle_len
-            {
-                return Ok(None); // No space left for the needle or already past the end
+            let end = slf.end;
+            let mut found = Vec::with_capacity(batch);
+            let mut pos = slf.current_pos;
+            // Stop when there's no space left for the needle before the end of the search.
+            while found.len() < batch && pos < end && end - pos >= needle_len {
+                match helpers::find_bitvec_with_table(
+                    &haystack_rs,
+                    &needle_rs,
+                    pos,
+                    end,
+                    slf.byte_aligned,
+                    &slf.table,
+                ) {
+                    Some(p) => {
+                        found.push(p);
+                        pos = p + slf.step;
+                    }
+                    None => {
+                        pos = end;
+                        break;
+                    }
+                }
             }
-            helpers::find_bitvec(&haystack_rs, &needle_rs, current_pos, slf.end, byte_aligned)
+            (found, pos)
         };
 
-        // Now, `slf` can be mutably accessed without conflicting with the previous borrows.
-        match find_result {
-            Some(pos) => {
-                slf.current_pos = pos + step;
-                Ok(Some(pos))
-            }
-            None => Ok(None),
+        slf.current_pos = next_pos;
+        slf.batch = (2 * batch).min(MAX_FIND_BATCH);
+        slf.pending.extend(found);
+        Ok(slf.pending.pop_front())
+    }
+}
+
+#[pyclass(module = "tibs")]
+pub struct RFindAllIterator {
+    pub haystack: Py<Tibs>,
+    pub needle: Py<Tibs>,
+    pub start: usize,
+    pub byte_aligned: bool,
+    pub step: usize,
+    pub current_end: usize, // Only matches that finish at or before this are still to be found
+    pub pending: VecDeque<usize>,
+    pub batch: usize,
+}
+
+#[pymethods]
+impl RFindAllIterator {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(mut slf: PyRefMut<'_, Self>) -> PyResult<Option<usize>> {
+        if let Some(pos) = slf.pending.pop_front() {
+            return Ok(Some(pos));
         }
+        let py = slf.py();
+
+        // Batched in the same way as FindAllIterator, but working back from the end.
+        let batch = slf.batch;
+        let (found, next_end) = {
+            let haystack_rs = slf.haystack.borrow(py);
+            let needle_rs = slf.needle.borrow(py);
+
+            let needle_len = needle_rs.len();
+            if needle_len == 0 {
+                return Ok(None);
+            }
+
+            let start = slf.start;
+            let mut found = Vec::with_capacity(batch);
+            let mut end = slf.current_end;
+            while found.len() < batch && end >= start + needle_len {
+                match helpers::rfind_bitvec(
+                    &haystack_rs.data,
+                    &needle_rs.data,
+                    start,
+                    end,
+                    slf.byte_aligned,
+                ) {
+                    Some(p) if p >= start + slf.step => {
+                        found.push(p);
+                        // The next match can overlap this one, so long as it starts earlier.
+                        end = p - slf.step + needle_len;
+                    }
+                    Some(p) => {
+                        found.push(p);
+                        end = start;
+                    }
+                    None => {
+                        end = start;
+                    }
+                }
+            }
+            (found, end)
+        };
+
+        slf.current_end = next_end;
+        slf.batch = (2 * batch).min(MAX_FIND_BATCH);
+        slf.pending.extend(found);
+        Ok(slf.pending.pop_front())
     }
 }
 
-#[pyclass]
+#[pyclass(module = "tibs")]
 pub struct ChunksIterator {
     pub(crate) bits_object: Py<Tibs>,
     pub(crate) chunk_size: usize,
@@ -121,8 +211,7 @@ impl ChunksIterator {
         // Borrow only long enough to copy out the bits slice
         let chunk_bits = {
             let bits = slf.bits_object.borrow(slf.py());
-            let slice = &bits.data[start..end];
-            Tibs::new(slice.to_bitvec())
+            bits.slice(start, end - start)
         };
 
         slf.current_pos = end;
@@ -1,6 +1,10 @@
 #[cfg(test)]
 mod tests {
     use crate::core::BitCollection;
+    use crate::helpers::{
+        delete_stride, eq_bits, matches_at, normalize_extended_slice, reverse_bits, rotate_left,
+        set_stride, swap_byte_groups, write_bits,
+    };
     use crate::tibs_::Tibs;
     use crate::mutibs::Mutibs;
 
@@ -29,6 +33,17 @@ mod tests {
         assert_eq!(mb.to_binary(), "001100");
     }
 
+    #[test]
+    fn test_set_slice_changing_length() {
+        let mut mb = <Mutibs as BitCollection>::from_zeros(6);
+        mb._set_slice(2, 4, &<Tibs as BitCollection>::from_ones(5));
+        assert_eq!(mb.to_binary(), "001111100");
+        mb._set_slice(1, 7, &<Tibs as BitCollection>::from_zeros(1));
+        assert_eq!(mb.to_binary(), "0000");
+        mb._set_slice(4, 4, &<Tibs as BitCollection>::from_ones(3));
+        assert_eq!(mb.to_binary(), "0000111");
+    }
+
     #[test]
     fn test_iand_ior_ixor() {
         let mut mb1 = <Mutibs as BitCollection>::from_ones(4);
@@ -51,4 +66,165 @@ mod tests {
     assert_eq!(mb.to_hexadecimal().unwrap(), "00345678");
     }
 
+    #[test]
+    fn test_delete_stride() {
+        let mb = Mutibs::from_binary("100111101001001110110100101").unwrap();
+        let (first, count, step) = normalize_extended_slice(0, 27, 2).unwrap();
+        let bits = Tibs::new(delete_stride(&mb.inner.data, first, count, step));
+        assert_eq!(bits.to_bin(), "0110010101100");
+        // Negative step over more than one 64-bit chunk.
+        let mb = <Mutibs as BitCollection>::from_ones(200);
+        let (first, count, step) = normalize_extended_slice(199, 0, -3).unwrap();
+        assert_eq!((first, count, step), (1, 67, 3));
+        let bits = Tibs::new(delete_stride(&mb.inner.data, first, count, step));
+        assert_eq!(bits.len(), 133);
+        assert!(bits.all());
+    }
+
+    #[test]
+    fn test_tibs_new_is_canonical() {
+        let mut mb = <Mutibs as BitCollection>::from_ones(16);
+        mb.inner.data.truncate(9);
+        let t = mb.to_tibs();
+        assert_eq!(t.data.as_raw_slice(), &[0xff, 0x80]);
+        assert!(t.eq_canonical(&Tibs::from_binary("111111111").unwrap()));
+        let shifted = Tibs::new(mb.inner.data[3..].to_bitvec());
+        assert_eq!(shifted.data.as_raw_slice(), &[0xfc]);
+        assert_eq!(shifted.len(), 6);
+    }
+
+    #[test]
+    fn test_write_bits() {
+        let source = Mutibs::from_binary("1011000111101001011").unwrap();
+        for len in [0, 1, 5, 8, 9, 16, 19] {
+            for src_start in [0, 3] {
+                let len = len.min(19 - src_start);
+                let src = &source.inner.data[src_start..src_start + len];
+                for start in 0..=(40 - len) {
+                    let mut expected = <Mutibs as BitCollection>::from_ones(40).inner.data;
+                    expected[start..start + len].copy_from_bitslice(src);
+                    let mut actual = <Mutibs as BitCollection>::from_ones(40).inner.data;
+                    write_bits(&mut actual, start, src);
+                    assert_eq!(actual, expected, "{len} {src_start} {start}");
+                }
+            }
+        }
+    }
+
+    #[test]
+    fn test_set_stride() {
+        let mut mb = <Mutibs as BitCollection>::from_zeros(200);
+        let values = <Tibs as BitCollection>::from_ones(66);
+        set_stride(&mut mb.inner.data, 1, 3, &values.data);
+        for i in 0..200 {
+            assert_eq!(mb.inner.data[i], i % 3 == 1 && i < 197, "bit {i}");
+        }
+        let mut mb = Mutibs::from_binary("0000000000").unwrap();
+        let values = Tibs::from_binary("101").unwrap();
+        set_stride(&mut mb.inner.data, 2, 2, &values.data);
+        assert_eq!(mb.to_bin(), "0010001000");
+    }
+
+    #[test]
+    fn test_rotate_left() {
+        for len in [1, 4, 13, 63, 64, 65, 130] {
+            let mb = <Mutibs as BitCollection>::from_binary(&"1101000".repeat(20)[..len]).unwrap();
+            for n in 0..len {
+                let mut expected = mb.inner.data.clone();
+                expected.rotate_left(n);
+                let mut actual = mb.inner.data.clone();
+                rotate_left(&mut actual, n);
+                assert_eq!(actual, expected);
+            }
+        }
+        // Rotating a slice must leave the surrounding bits alone.
+        let mut mb = Mutibs::from_binary("1110110001").unwrap();
+        rotate_left(&mut mb.inner.data[2..6], 1);
+        assert_eq!(mb.to_bin(), "1101110001");
+    }
+
+    #[test]
+    fn test_reverse_bits() {
+        for len in [0, 1, 7, 8, 9, 13, 63, 64, 65, 130] {
+            let mb = <Mutibs as BitCollection>::from_binary(&"1101000".repeat(20)[..len]).unwrap();
+            let mut expected = mb.inner.data.clone();
+            expected.reverse();
+            let mut actual = mb.inner.data.clone();
+            reverse_bits(&mut actual);
+            assert_eq!(actual, expected);
+        }
+        // Bits that start part way into the first byte.
+        let mb = Mutibs::from_binary("1110110001").unwrap();
+        let mut actual = mb.inner.data[3..].to_bitvec();
+        reverse_bits(&mut actual);
+        assert_eq!(actual, Mutibs::from_binary("1000110").unwrap().inner.data);
+    }
+
+    #[test]
+    fn test_eq_bits_ignores_junk_tail() {
+        let t = Tibs::from_binary("1011001110").unwrap();
+        let mut mb = Mutibs::from_binary("10110011101").unwrap();
+        mb.inner.data.pop();
+        assert!(mb.inner.data.as_raw_slice()[1] != t.data.as_raw_slice()[1]);
+        assert!(eq_bits(&mb.inner.data, &t.data));
+        assert!(mb == t);
+        mb.inner.data.set(9, true);
+        assert!(!eq_bits(&mb.inner.data, &t.data));
+        // Bits that start part way into the first byte.
+        let shifted = Mutibs::from_binary("0111011001110").unwrap().inner.data[3..].to_bitvec();
+        assert!(eq_bits(&shifted, &t.data));
+        assert!(!eq_bits(&shifted[..9].to_bitvec(), &t.data));
+    }
+
+    #[test]
+    fn test_matches_at_against_slices() {
+        let tibs = Tibs::from_binary("01110110011101011100001111").unwrap();
+        let bits = tibs.data;
+        let shifted = bits[3..].to_bitvec();
+        for haystack in [&bits, &shifted] {
+            for start in 0..=haystack.len() {
+                for end in start..=haystack.len() {
+                    let pattern = Tibs::new(haystack[start..end].to_bitvec());
+                    assert!(matches_at(haystack, start, &pattern.data));
+                    let mut flipped = pattern.data.clone();
+                    if let Some(last) = end.checked_sub(start + 1) {
+                        let value = flipped[last];
+                        flipped.set(last, !value);
+                        assert!(!matches_at(haystack, start, &flipped));
+                    }
+                }
+            }
+            // A pattern running off the end never matches.
+            assert!(!matches_at(haystack, 1, haystack));
+        }
+    }
+
+    #[test]
+    fn test_swap_byte_groups() {
+        for group in [1, 2, 3, 4, 8, 16, 24] {
+            let mut bytes: Vec<u8> = (0..group as u8 * 5).collect();
+            let mut expected = bytes.clone();
+            expected.chunks_mut(group).for_each(|chunk| chunk.reverse());
+            swap_byte_groups(&mut bytes, group);
+            assert_eq!(bytes, expected);
+        }
+    }
+
+    #[test]
+    fn test_replace_whole_bytes() {
+        let new = <Tibs as BitCollection>::from_bytes(vec![0xab, 0xcd]);
+        let mut mb = <Mutibs as BitCollection>::from_bytes(vec![1, 2, 3, 4, 5, 6, 7]);
+        mb.replace_whole_bytes(&[8, 40], 8, &new);
+        assert_eq!(mb.to_bytes(), vec![1, 0xab, 0xcd, 3, 4, 5, 0xab, 0xcd, 7]);
+        let short = <Tibs as BitCollection>::from_bytes(vec![0xee]);
+        mb.replace_whole_bytes(&[8, 48], 16, &short);
+        assert_eq!(mb.to_bytes(), vec![1, 0xee, 3, 4, 5, 0xee, 7]);
+        mb.replace_whole_bytes(&[0], 16, &<Tibs as BitCollection>::from_bytes(vec![]));
+        assert_eq!(mb.to_bytes(), vec![3, 4, 5, 0xee, 7]);
+        // A trailing partial byte is carried across unchanged.
+        let mut mb = Mutibs::from_binary("000000011111111110").unwrap();
+        mb.replace_whole_bytes(&[8], 8, &Tibs::from_binary("0000111100001111").unwrap());
+        assert_eq!(mb.to_bin(), "00000001000011110000111110");
+    }
+
 }
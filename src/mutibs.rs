@@ -1,17 +1,20 @@
-use crate::core::str_to_tibs;
+use crate::core::{eq_string_literal, str_to_tibs};
 use crate::core::validate_logical_op_lengths;
 use crate::core::BitCollection;
-use crate::helpers::{find_bitvec, validate_index, validate_slice, BV};
+use crate::helpers::{
+    delete_stride, eq_bits, find_bitvec_with_table, invert_words, normalize_extended_slice,
+    reverse_bits, rotate_left, search_table, set_stride, swap_byte_groups, validate_index,
+    validate_slice, write_bits, BS, BV,
+};
 use crate::iterator::ChunksIterator;
 use crate::tibs_::{tibs_from_any, Tibs};
 use pyo3::exceptions::{PyIndexError, PyTypeError, PyValueError};
 use pyo3::prelude::{PyAnyMethods, PyTypeMethods};
-use pyo3::types::{PyBool, PySlice};
+use pyo3::types::{PyBool, PyBytes, PySlice, PyString, PyStringMethods};
 use pyo3::types::{PySliceMethods, PyType};
 use pyo3::PyRefMut;
 use pyo3::{pyclass, pymethods, PyRef, PyResult, Python};
 use pyo3::{Bound, IntoPyObject, Py, PyAny};
-use std::ops::Not;
 
 pub fn mutibs_from_any(any: Bound<'_, PyAny>) -> PyResult<Mutibs> {
     if let Ok(any_bits) = any.extract::<PyRef<Tibs>>() {
@@ -24,11 +27,11 @@ pub fn mutibs_from_any(any: Bound<'_, PyAny>) -> PyResult<Mutibs> {
 
     if let Ok(any_string) = any.extract::<String>() {
         let bits = str_to_tibs(any_string)?;
-        return Ok(bits.to_mutibs());
+        return Ok(Mutibs::new(bits.data));
     }
     if let Ok(any_bytes) = any.extract::<Vec<u8>>() {
         let bits = <Tibs as BitCollection>::from_bytes(any_bytes);
-        return Ok(bits.to_mutibs());
+        return Ok(Mutibs::new(bits.data));
     }
     let type_name = match any.get_type().name() {
         Ok(name) => name.to_string(),
@@ -68,6 +71,14 @@ impl Mutibs {
             ._getslice_with_step(start_bit, end_bit, step)
             .map(|bits| Mutibs { inner: bits })
     }
+
+    /// Apply one of the in-place logical operators, `op`, to self and `other`, which must have
+    /// the same length.
+    fn combine_in_place(&mut self, other: &BS, op: impl FnOnce(&mut BV, &BS)) -> PyResult<()> {
+        validate_logical_op_lengths(self.len(), other.len())?;
+        op(&mut self.inner.data, other);
+        Ok(())
+    }
 }
 
 #[pymethods]
@@ -79,7 +90,7 @@ impl Mutibs {
             return Ok(BitCollection::empty());
         };
         if let Ok(string_s) = s.extract::<String>() {
-            return str_to_tibs(string_s).map(|bits| bits.to_mutibs());
+            return str_to_tibs(string_s).map(|bits| Mutibs::new(bits.data));
         }
 
         // If it's not a string, build a more helpful error message.
@@ -91,7 +102,7 @@ impl Mutibs {
 
         if s.is_instance_of::<Tibs>() {
             err.push_str("You can use the 'to_mutibs()' method on the `Tibs` instance instead.");
-        } else if s.is_instance_of::<pyo3::types::PyBytes>()
+        } else if s.is_instance_of::<PyBytes>()
             || s.is_instance_of::<pyo3::types::PyByteArray>()
             || s.is_instance_of::<pyo3::types::PyMemoryView>()
         {
@@ -123,20 +134,27 @@ impl Mutibs {
     pub fn __eq__(&self, other: Py<PyAny>, py: Python) -> bool {
         let obj = other.bind(py);
         if let Ok(b) = obj.extract::<PyRef<Tibs>>() {
-            return self.inner.data == b.data;
+            return eq_bits(&self.inner.data, &b.data);
         }
         if let Ok(b) = obj.extract::<PyRef<Mutibs>>() {
-            return self.inner.data == b.inner.data;
+            return eq_bits(&self.inner.data, &b.inner.data);
+        }
+        if let Ok(s) = obj.cast::<PyString>() {
+            if let Ok(s) = s.to_cow() {
+                if let Some(equal) = eq_string_literal(&self.inner.data, &s) {
+                    return equal;
+                }
+            }
         }
         match tibs_from_any(other.bind(py).clone()) {
-            Ok(b) => self.inner.data == b.data,
+            Ok(b) => eq_bits(&self.inner.data, &b.data),
             Err(_) => false,
         }
     }
 
     /// Return string representations for printing.
     pub fn __str__(&self) -> String {
-        self.inner.__str__()
+        self.inner.build_str(false)
     }
 
     /// Return representation that could be used to recreate the instance.
@@ -150,7 +168,7 @@ impl Mutibs {
     }
 
     pub fn _overwrite(&mut self, start: usize, value: &Tibs) {
-        self.inner.data[start..start + value.len()].copy_from_bitslice(&value.data);
+        write_bits(&mut self.inner.data, start, &value.data);
     }
 
     pub fn _set_slice(&mut self, start: usize, end: usize, value: &Tibs) {
@@ -158,36 +176,20 @@ impl Mutibs {
             // This is an overwrite, so no need to move data around.
             self._overwrite(start, value);
         } else {
-            if start == end {
-                // Not sure why but splice doesn't work for this case, so we do it explicitly
-                let tail = self.inner.data.split_off(start);
-                self.inner.data.extend_from_bitslice(&value.data);
-                self.inner.data.extend_from_bitslice(&tail);
-            } else {
-                let tail = self.inner.data.split_off(end);
-                self.inner.data.truncate(start);
-                self.inner.data.extend_from_bitslice(&value.data);
-                self.inner.data.extend_from_bitslice(&tail);
-            }
+            self.splice(start, end, &value.data);
         }
     }
 
     pub fn _ixor(&mut self, other: &Mutibs) -> PyResult<()> {
-        validate_logical_op_lengths(self.len(), other.len())?;
-        self.inner.data ^= &other.inner.data;
-        Ok(())
+        self.combine_in_place(&other.inner.data, |a, b| *a ^= b)
     }
 
     pub fn _ior(&mut self, other: &Mutibs) -> PyResult<()> {
-        validate_logical_op_lengths(self.len(), other.len())?;
-        self.inner.data |= &other.inner.data;
-        Ok(())
+        self.combine_in_place(&other.inner.data, |a, b| *a |= b)
     }
 
     pub fn _iand(&mut self, other: &Mutibs) -> PyResult<()> {
-        validate_logical_op_lengths(self.len(), other.len())?;
-        self.inner.data &= &other.inner.data;
-        Ok(())
+        self.combine_in_place(&other.inner.data, |a, b| *a &= b)
     }
 
     pub fn _or(&self, other: &Tibs) -> PyResult<Self> {
@@ -234,7 +236,7 @@ impl Mutibs {
     ///     a = Mutibs("0xff01")  # Mutibs(s) is equivalent to Mutibs.from_string(s)
     #[classmethod]
     pub fn from_string(_cls: &Bound<'_, PyType>, s: String) -> PyResult<Self> {
-        str_to_tibs(s).map(|bits| bits.to_mutibs())
+        str_to_tibs(s).map(|bits| Mutibs::new(bits.data))
     }
 
     #[classmethod]
@@ -313,12 +315,8 @@ impl Mutibs {
     ///     a = Mutibs.from_bools([False, 0, 1, "Steven"])  # binary 0011
     ///
     #[classmethod]
-    pub fn from_bools(
-        _cls: &Bound<'_, PyType>,
-        values: Vec<Py<PyAny>>,
-        py: Python,
-    ) -> PyResult<Self> {
-        Ok(Tibs::from_bools(_cls, values, py)?.to_mutibs())
+    pub fn from_bools(_cls: &Bound<'_, PyType>, values: &Bound<'_, PyAny>) -> PyResult<Self> {
+        Ok(Mutibs::new(Tibs::from_bools(_cls, values)?.data))
     }
 
     /// Create a new instance with all bits pseudo-randomly set.
@@ -342,7 +340,7 @@ impl Mutibs {
         length: i64,
         seed: Option<Vec<u8>>,
     ) -> PyResult<Self> {
-        Ok(Tibs::from_random(_cls, length, seed)?.to_mutibs())
+        Ok(Mutibs::new(Tibs::from_random(_cls, length, seed)?.data))
     }
 
     /// Create a new instance from a bytes object.
@@ -378,7 +376,7 @@ impl Mutibs {
     ///
     #[classmethod]
     pub fn from_joined(_cls: &Bound<'_, PyType>, sequence: &Bound<'_, PyAny>) -> PyResult<Self> {
-        Ok(Tibs::from_joined(_cls, sequence)?.to_mutibs())
+        Ok(Mutibs::new(Tibs::from_joined(_cls, sequence)?.data))
     }
 
     pub fn _to_u64(&self, start: usize, length: usize) -> u64 {
@@ -494,38 +492,27 @@ impl Mutibs {
                     "The step in __setitem__ must not be zero.",
                 ));
             }
-            // Compute target indices in the natural slice order (respecting step sign).
-            let mut positions: Vec<usize> = Vec::new();
-            if step > 0 {
-                debug_assert!(start >= 0);
-                debug_assert!(stop >= 0);
-                let mut i = start;
-                while i < stop {
-                    positions.push(i as usize);
-                    i += step;
-                }
-            } else {
-                // TODO: with a negative step I think start or stop could be -1.
-                let mut i = start;
-                while i > stop {
-                    positions.push(i as usize);
-                    i += step; // step < 0
-                }
-            }
+            let extended = normalize_extended_slice(start, stop, step);
+            let count = extended.map_or(0, |(_, count, _)| count);
 
             // Enforce equal sizes.
-            if bs.len() != positions.len() {
+            if bs.len() != count {
                 return Err(PyValueError::new_err(format!(
                     "Attempt to assign sequence of size {} to extended slice of size {}",
                     bs.len(),
-                    positions.len()
+                    count
                 )));
             }
 
-            // Assign element-wise.
-            for (k, &pos) in positions.iter().enumerate() {
-                let v = bs.data[k];
-                slf.inner.data.set(pos, v);
+            // Assign with a stride from the lowest position, reversing the values for a negative step.
+            if let Some((first, _, stride)) = extended {
+                if step > 0 {
+                    set_stride(&mut slf.inner.data, first, stride, &bs.data);
+                } else {
+                    let mut reversed = bs.data;
+                    reverse_bits(&mut reversed);
+                    set_stride(&mut slf.inner.data, first, stride, &reversed);
+                }
             }
 
             return Ok(());
@@ -556,30 +543,9 @@ impl Mutibs {
                 if stop > start {
                     self.inner.data.drain(start as usize..stop as usize);
                 }
-            } else {
-                // Collect indices to remove, then remove from highest to lowest.
-                let mut to_remove: Vec<usize> = if step > 0 {
-                    let mut v = Vec::new();
-                    let mut i = start;
-                    while i < stop {
-                        v.push(i as usize);
-                        i += step;
-                    }
-                    v
-                } else {
-                    let mut v = Vec::new();
-                    let mut i = start;
-                    while i > stop {
-                        v.push(i as usize);
-                        i += step; // step < 0
-                    }
-                    v
-                };
-
-                to_remove.sort();
-                for i in to_remove.into_iter().rev() {
-                    self.inner.data.remove(i);
-                }
+            } else if let Some((first, count, step)) = normalize_extended_slice(start, stop, step) {
+                // Rebuild in a single pass rather than removing the bits one at a time.
+                self.inner.data = delete_stride(&self.inner.data, first, count, step);
             }
             return Ok(());
         }
@@ -720,6 +686,46 @@ impl Mutibs {
         other._xor(&self.inner)
     }
 
+    /// In-place bit-wise 'and' with another Mutibs or object that can be converted to a Tibs.
+    ///
+    /// Raises ValueError if the two have differing lengths.
+    ///
+    pub fn __iand__(mut slf: PyRefMut<'_, Self>, bs: Py<PyAny>, py: Python<'_>) -> PyResult<()> {
+        // x & x == x
+        if bs.as_ptr() != slf.as_ptr() {
+            let other = tibs_from_any(bs.bind(py).clone())?;
+            slf.combine_in_place(&other.data, |a, b| *a &= b)?;
+        }
+        Ok(())
+    }
+
+    /// In-place bit-wise 'or' with another Mutibs or object that can be converted to a Tibs.
+    ///
+    /// Raises ValueError if the two have differing lengths.
+    ///
+    pub fn __ior__(mut slf: PyRefMut<'_, Self>, bs: Py<PyAny>, py: Python<'_>) -> PyResult<()> {
+        // x | x == x
+        if bs.as_ptr() != slf.as_ptr() {
+            let other = tibs_from_any(bs.bind(py).clone())?;
+            slf.combine_in_place(&other.data, |a, b| *a |= b)?;
+        }
+        Ok(())
+    }
+
+    /// In-place bit-wise 'xor' with another Mutibs or object that can be converted to a Tibs.
+    ///
+    /// Raises ValueError if the two have differing lengths.
+    ///
+    pub fn __ixor__(mut slf: PyRefMut<'_, Self>, bs: Py<PyAny>, py: Python<'_>) -> PyResult<()> {
+        if bs.as_ptr() == slf.as_ptr() {
+            // x ^ x == 0
+            slf.inner.data.fill(false);
+            return Ok(());
+        }
+        let other = tibs_from_any(bs.bind(py).clone())?;
+        slf.combine_in_place(&other.data, |a, b| *a ^= b)
+    }
+
     /// Rotates bit pattern to the left. Returns self.
     ///
     /// :param n: The number of bits to rotate by.
@@ -750,8 +756,11 @@ impl Mutibs {
         }
 
         let (start, end) = validate_slice(slf.len(), start, end)?;
+        if start == end {
+            return Ok(slf);
+        }
         let n = (n % (end as i64 - start as i64)) as usize;
-        slf.inner.data[start..end].rotate_left(n);
+        rotate_left(&mut slf.inner.data[start..end], n);
         Ok(slf)
     }
 
@@ -785,8 +794,12 @@ impl Mutibs {
         }
 
         let (start, end) = validate_slice(slf.len(), start, end)?;
-        let n = (n % (end as i64 - start as i64)) as usize;
-        slf.inner.data[start..end].rotate_right(n);
+        let length = end - start;
+        if length == 0 {
+            return Ok(slf);
+        }
+        let n = (n % length as i64) as usize;
+        rotate_left(&mut slf.inner.data[start..end], (length - n) % length);
         Ok(slf)
     }
 
@@ -912,18 +925,31 @@ impl Mutibs {
     ) -> PyResult<PyRefMut<'a, Self>> {
         match pos {
             None => {
-                slf.inner.data = std::mem::take(&mut slf.inner.data).not();
+                let data = &mut slf.inner.data;
+                data.force_align();
+                invert_words(data.as_raw_mut_slice());
             }
             Some(p) => {
+                let len = slf.len();
+                let data = &mut slf.inner.data;
                 if let Ok(pos) = p.extract::<i64>() {
-                    let pos: usize = validate_index(pos, slf.len())?;
-                    let value = slf.inner.data[pos];
-                    slf.inner.data.set(pos, !value);
+                    let pos: usize = validate_index(pos, len)?;
+                    let value = data[pos];
+                    data.set(pos, !value);
+                } else if p.is_instance_of::<pyo3::types::PyRange>() {
+                    // Step through the range here rather than making a Python int for each position.
+                    let start = p.getattr("start")?.extract::<i64>()?;
+                    let step = p.getattr("step")?.extract::<i64>()?;
+                    for k in 0..p.len()? as i64 {
+                        let pos: usize = validate_index(start + k * step, len)?;
+                        let value = data[pos];
+                        data.set(pos, !value);
+                    }
                 } else if let Ok(pos_list) = p.extract::<Vec<i64>>() {
                     for pos in pos_list {
-                        let pos: usize = validate_index(pos, slf.len())?;
-                        let value = slf.inner.data[pos];
-                        slf.inner.data.set(pos, !value);
+                        let pos: usize = validate_index(pos, len)?;
+                        let value = data[pos];
+                        data.set(pos, !value);
                     }
                 } else {
                     return Err(PyTypeError::new_err(
@@ -946,7 +972,7 @@ impl Mutibs {
     ///     Mutibs('0b1101')
     ///
     pub fn reverse(mut slf: PyRefMut<'_, Self>) -> PyRefMut<'_, Self> {
-        slf.inner.data.reverse();
+        reverse_bits(&mut slf.inner.data);
         slf
     }
 
@@ -992,11 +1018,11 @@ impl Mutibs {
             )));
         }
 
-        let mut bytes = slf.inner._slice_to_bytes(0, len)?;
-        for chunk in bytes.chunks_mut(byte_length) {
-            chunk.reverse();
-        }
-        slf.inner.data = BV::from_vec(bytes);
+        // Swapped in place. The length is whole bytes, so once aligned the raw bytes are exactly
+        // the data.
+        let data = &mut slf.inner.data;
+        data.force_align();
+        swap_byte_groups(data.as_raw_mut_slice(), byte_length);
         Ok(slf)
     }
 
@@ -1008,7 +1034,7 @@ impl Mutibs {
         if self.inner.data.is_empty() {
             return Err(PyValueError::new_err("Cannot invert empty Mutibs."));
         }
-        Ok(Mutibs::new(self.inner.data.clone().not()))
+        Ok(Mutibs::new(self.inner.inverted().data))
     }
 
     /// Return new Mutibs shifted by n to the left.
@@ -1028,7 +1054,9 @@ impl Mutibs {
     }
 
     pub fn _set_index(&mut self, value: bool, index: i64) -> PyResult<()> {
-        self._set_from_sequence(value, vec![index])
+        let pos = validate_index(index, self.len())?;
+        self.inner.data.set(pos, value);
+        Ok(())
     }
 
     // Just redirects to the Tibs._chunks method. Not public part of Python interface
@@ -1081,6 +1109,13 @@ impl Mutibs {
 
         let mut index = positive_start as usize;
         let stop = positive_stop as usize;
+        if positive_step == 1 {
+            // A contiguous run is filled a whole byte at a time, with only the end bytes masked.
+            if index < stop {
+                self.inner.data[index..stop].fill(value);
+            }
+            return Ok(());
+        }
 
         while index < stop {
             unsafe {
@@ -1198,9 +1233,7 @@ impl Mutibs {
     ) -> PyResult<()> {
         // Check if bs is the same object as slf
         if bs.as_ptr() == slf.as_ptr() {
-            // If bs is slf, clone inner bits first then append
-            let bits_clone = slf.inner.data.clone();
-            slf.inner.data.extend_from_bitslice(&bits_clone);
+            slf.append_self();
         } else {
             // Normal case - convert bs to Tibs and append
             let bs = tibs_from_any(bs.bind(py).clone())?;
@@ -1227,9 +1260,7 @@ impl Mutibs {
     ) -> PyResult<PyRefMut<'a, Self>> {
         // Check if bs is the same object as slf
         if bs.as_ptr() == slf.as_ptr() {
-            // If bs is slf, clone inner bits first then append
-            let bits_clone = slf.inner.data.clone();
-            slf.inner.data.extend_from_bitslice(&bits_clone);
+            slf.append_self();
         } else {
             // Normal case - convert bs to Tibs and append
             let bs = tibs_from_any(bs.bind(py).clone())?;
@@ -1256,17 +1287,15 @@ impl Mutibs {
     ) -> PyResult<PyRefMut<'a, Self>> {
         // Check for self-prepending
         if bs.as_ptr() == slf.as_ptr() {
-            let mut new_data = slf.inner.data.clone();
-            new_data.extend_from_bitslice(&slf.inner.data);
-            slf.inner.data = new_data;
+            // Prepending to itself is the same as appending.
+            slf.append_self();
         } else {
             let to_prepend = tibs_from_any(bs.bind(py).clone())?;
             if to_prepend.is_empty() {
                 return Ok(slf);
             }
-            let mut new_data = to_prepend.data;
-            new_data.extend_from_bitslice(&slf.inner.data);
-            slf.inner.data = new_data;
+            // Shift the existing bits up in place so that the current buffer is reused.
+            slf.splice(0, 0, &to_prepend.data);
         }
         Ok(slf)
     }
@@ -1291,6 +1320,7 @@ impl Mutibs {
         let (start, end) = validate_slice(slf.len(), start, end)?;
 
         // Find all non-overlapping occurrences
+        let table = search_table(&old);
         let mut starting_points: Vec<usize> = Vec::new();
         let mut current_pos = start;
         while current_pos < end {
@@ -1299,7 +1329,9 @@ impl Mutibs {
                     break;
                 }
             }
-            if let Some(found_pos) = find_bitvec(&slf.inner, &old, current_pos, end, byte_aligned) {
+            if let Some(found_pos) =
+                find_bitvec_with_table(&slf.inner, &old, current_pos, end, byte_aligned, &table)
+            {
                 starting_points.push(found_pos);
                 current_pos = found_pos + old.len();
             } else {
@@ -1311,15 +1343,48 @@ impl Mutibs {
             return Ok(slf);
         }
 
-        // Rebuild the bitstring with replacements
-        let mut result = BV::new();
+        if old.len() % 8 == 0 && new.len() % 8 == 0 && starting_points.iter().all(|p| p % 8 == 0) {
+            // Everything lines up with bytes, so the data can be moved with plain byte copies.
+            slf.replace_whole_bytes(&starting_points, old.len(), &new);
+            return Ok(slf);
+        }
+
+        if new.len() <= old.len() {
+            // Compact in place. The write position never overtakes the read position.
+            let data = &mut slf.inner.data;
+            let mut write_pos = starting_points[0];
+            let mut last_pos = starting_points[0];
+            for &pos in &starting_points {
+                if write_pos != last_pos {
+                    data.copy_within(last_pos..pos, write_pos);
+                }
+                write_pos += pos - last_pos;
+                write_bits(data, write_pos, &new.data);
+                write_pos += new.len();
+                last_pos = pos + old.len();
+            }
+            let total_len = data.len();
+            if write_pos != last_pos {
+                data.copy_within(last_pos..total_len, write_pos);
+                data.truncate(write_pos + total_len - last_pos);
+            }
+            return Ok(slf);
+        }
+
+        // Rebuild the bitstring with replacements. Each piece is written straight to its final
+        // place, as shifted bytes wherever it starts on a byte boundary.
+        let mut result =
+            BV::repeat(false, slf.len() + starting_points.len() * (new.len() - old.len()));
+        let mut write_pos = 0;
         let mut last_pos = 0;
         for &pos in &starting_points {
-            result.extend_from_bitslice(&slf.inner.data[last_pos..pos]);
-            result.extend_from_bitslice(&new.data);
+            write_bits(&mut result, write_pos, &slf.inner.data[last_pos..pos]);
+            write_pos += pos - last_pos;
+            write_bits(&mut result, write_pos, &new.data);
+            write_pos += new.len();
             last_pos = pos + old.len();
         }
-        result.extend_from_bitslice(&slf.inner.data[last_pos..]);
+        write_bits(&mut result, write_pos, &slf.inner.data[last_pos..]);
 
         slf.inner.data = result;
         Ok(slf)
@@ -1345,15 +1410,6 @@ impl Mutibs {
         bs: Py<PyAny>,
         py: Python<'_>,
     ) -> PyResult<PyRefMut<'a, Self>> {
-        // Check for self assignment
-        let bs = if bs.as_ptr() == slf.as_ptr() {
-            Mutibs::new(slf.inner.data.clone())
-        } else {
-            mutibs_from_any(bs.bind(py).clone())?
-        };
-        if bs.len() == 0 {
-            return Ok(slf);
-        }
         if pos < 0 {
             pos += slf.len() as i64;
         }
@@ -1363,13 +1419,26 @@ impl Mutibs {
         } else if pos > slf.len() as i64 {
             pos = slf.len() as i64;
         }
+        // Check for self assignment. The result is built in one allocation straight from the
+        // original data, so no defensive copy of self is needed.
+        if bs.as_ptr() == slf.as_ptr() {
+            let data = &slf.inner.data;
+            let mut result = BV::with_capacity(2 * data.len());
+            result.extend_from_bitslice(&data[..pos as usize]);
+            result.extend_from_bitslice(data);
+            result.extend_from_bitslice(&data[pos as usize..]);
+            slf.inner.data = result;
+            return Ok(slf);
+        }
+        let bs = mutibs_from_any(bs.bind(py).clone())?;
+        if bs.len() == 0 {
+            return Ok(slf);
+        }
         if bs.len() == 1 {
             slf.inner.data.insert(pos as usize, bs.inner.data[0]);
             return Ok(slf);
         }
-        let tail = slf.inner.data.split_off(pos as usize);
-        slf.inner.data.extend_from_bitslice(&bs.inner.data);
-        slf.inner.data.extend_from_bitslice(&tail);
+        slf.splice(pos as usize, pos as usize, &bs.inner.data);
         Ok(slf)
     }
 
@@ -1413,8 +1482,8 @@ impl Mutibs {
         Ok(())
     }
 
-    pub fn __bytes__(&self) -> Vec<u8> {
-        self.inner.to_bytes()
+    pub fn __bytes__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.inner.__bytes__(py)
     }
 
     /// Return new Mutibs consisting of n concatenations of self.
@@ -1424,7 +1493,7 @@ impl Mutibs {
     /// n -- The number of concatenations. Must be >= 0.
     ///
     pub fn __mul__(&self, n: i64) -> PyResult<Self> {
-        let x = self.inner.__mul__(n)?;
+        let x = self.inner.repeat(n)?;
         Ok(Mutibs::new(x.data))
     }
 
@@ -1444,5 +1513,5 @@ impl Mutibs {
         ))
     }
 
-    // TODO: iand, ior, ixor, imul
+    // TODO: imul
 }
@@ -1,27 +1,106 @@
 use crate::core::validate_logical_op_lengths;
-use crate::core::{str_to_tibs, BitCollection};
-use crate::helpers::{find_bitvec, validate_index, validate_slice, BV};
-use crate::iterator::{BoolIterator, ChunksIterator, FindAllIterator};
-use crate::mutibs::mutibs_from_any;
+use crate::core::{eq_string_literal, str_to_tibs, BitCollection};
+use crate::helpers::{
+    append_bits, contains_each, count_ones, eq_bits, find_bitvec, last_byte_mask, matches_at,
+    pack_bools, rfind_bitvec, search_table, validate_index, validate_slice, BV,
+};
+use crate::iterator::{BoolIterator, ChunksIterator, FindAllIterator, RFindAllIterator};
 use crate::mutibs::Mutibs;
 use bitvec::prelude::*;
-use bytemuck;
-use once_cell::sync::OnceCell;
+use once_cell::sync::{Lazy, OnceCell};
 use pyo3::conversion::IntoPyObject;
 use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::{
-    PyBool, PyByteArray, PyBytes, PyInt, PyList, PyMemoryView, PySlice, PyTuple, PyType,
+    PyBool, PyByteArray, PyBytes, PyDict, PyInt, PyList, PyMemoryView, PySlice, PyString, PyTuple,
+    PyType,
 };
 use pyo3::{pyclass, pymethods, PyRef, PyResult};
 use rand::rngs::StdRng;
 use rand::{RngCore, SeedableRng};
 use std::collections::hash_map::DefaultHasher;
+use std::collections::VecDeque;
 use std::hash::{Hash, Hasher};
-use std::ops::Not;
+use std::sync::Mutex;
+
+// Small all-zero Tibs are immutable, so a single instance of each length can be shared.
+const ZEROS_CACHE_SIZE: usize = 256;
+static ZEROS_CACHE: Lazy<Mutex<Vec<Option<Py<Tibs>>>>> =
+    Lazy::new(|| Mutex::new((0..=ZEROS_CACHE_SIZE).map(|_| None).collect()));
+
+// Likewise for the one-bit Tibs and the single bytes, which are the most often made from strings.
+// Entries 0 and 1 are the bits and 2 + b is the byte b.
+static SMALL_CACHE: Lazy<Mutex<Vec<Option<Py<Tibs>>>>> =
+    Lazy::new(|| Mutex::new((0..2 + 256).map(|_| None).collect()));
+
+/// The contents of `obj` if it's a one-dimensional buffer of single-byte items, such as a bytes,
+/// bytearray or a numpy uint8 or bool array. These can then be read without a Python object per item.
+fn single_byte_buffer<'py>(obj: &Bound<'py, PyAny>) -> Option<Bound<'py, PyBytes>> {
+    if obj.is_instance_of::<PyList>() || obj.is_instance_of::<PyTuple>() {
+        return None;
+    }
+    let view = PyMemoryView::from(obj).ok()?;
+    let itemsize: usize = view.getattr("itemsize").ok()?.extract().ok()?;
+    let ndim: usize = view.getattr("ndim").ok()?.extract().ok()?;
+    if itemsize != 1 || ndim != 1 {
+        return None;
+    }
+    view.call_method0("tobytes")
+        .ok()?
+        .cast_into::<PyBytes>()
+        .ok()
+}
+
+/// An all-zero Tibs, shared from ZEROS_CACHE for short lengths. The empty Tibs from any
+/// zero-length result also comes from here.
+fn cached_zeros(py: Python<'_>, length: usize) -> PyResult<Py<Tibs>> {
+    if length > ZEROS_CACHE_SIZE {
+        return Py::new(py, <Tibs as BitCollection>::from_zeros(length));
+    }
+    if let Some(zeros) = &ZEROS_CACHE.lock().unwrap()[length] {
+        return Ok(zeros.clone_ref(py));
+    }
+    // The lock isn't held while creating the object, so another thread may get there first.
+    let zeros = Py::new(py, <Tibs as BitCollection>::from_zeros(length))?;
+    Ok(ZEROS_CACHE.lock().unwrap()[length]
+        .get_or_insert(zeros)
+        .clone_ref(py))
+}
+
+/// `bits` as a Python object, shared from SMALL_CACHE if it's a single bit or a single byte, or
+/// from ZEROS_CACHE if it's a few zero bits.
+fn cached_small(py: Python<'_>, bits: Tibs) -> PyResult<Py<Tibs>> {
+    if bits.len() <= 8 && bits.data.not_any() {
+        return cached_zeros(py, bits.len());
+    }
+    let index = match bits.len() {
+        1 => bits.data[0] as usize,
+        8 => 2 + bits.data.as_raw_slice()[0] as usize,
+        _ => return Py::new(py, bits),
+    };
+    if let Some(small) = &SMALL_CACHE.lock().unwrap()[index] {
+        return Ok(small.clone_ref(py));
+    }
+    let small = Py::new(py, bits)?;
+    Ok(SMALL_CACHE.lock().unwrap()[index]
+        .get_or_insert(small)
+        .clone_ref(py))
+}
 
 // ---- Exported Python helper methods ----
 
+/// Call `f` with `any` converted to a Tibs. A Tibs is borrowed as it is rather than copied, which
+/// is all that the searches need.
+pub(crate) fn with_tibs<R>(
+    any: &Bound<'_, PyAny>,
+    f: impl FnOnce(&Tibs) -> PyResult<R>,
+) -> PyResult<R> {
+    if let Ok(bits) = any.extract::<PyRef<Tibs>>() {
+        return f(&bits);
+    }
+    f(&tibs_from_any(any.clone())?)
+}
+
 pub fn tibs_from_any(any: Bound<'_, PyAny>) -> PyResult<Tibs> {
     // Is it of type Tibs?
     if let Ok(any_bits) = any.extract::<PyRef<Tibs>>() {
@@ -84,43 +163,81 @@ pub fn tibs_from_any(any: Bound<'_, PyAny>) -> PyResult<Tibs> {
 ///     Using the constructor ``Tibs(s)`` is an alias for ``Tibs.from_string(s)``.
 ///
 #[derive(Clone)]
-#[pyclass(frozen, module = "tibs")]
+#[pyclass(frozen, freelist = 8, module = "tibs")]
 pub struct Tibs {
     pub(crate) data: BV,
     pub(crate) bin_cache: OnceCell<String>,
     pub(crate) oct_cache: OnceCell<String>,
     pub(crate) hex_cache: OnceCell<String>,
+    pub(crate) hash_cache: OnceCell<isize>,
 }
 
 impl Hash for Tibs {
     fn hash<H: Hasher>(&self, state: &mut H) {
+        if self.data.as_bitptr().bit().into_inner() != 0 {
+            // Only the inner Tibs of a Mutibs can start part way into a byte.
+            return Tibs::new(self.data.clone()).hash(state);
+        }
         self.len().hash(state);
-
-        let bits = self.data.as_bitslice();
-
-        let mut words = bits.chunks_exact(64);
-        for chunk in words.by_ref() {
-            state.write_u64(chunk.load_be::<u64>());
+        // The bytes go to the hasher in one write, which it consumes a word at a time. The final
+        // byte is masked, as a Mutibs can leave junk in its unused bits.
+        if let Some((last, rest)) = self.data.as_raw_slice().split_last() {
+            state.write(rest);
+            state.write_u8(last & last_byte_mask(self.len()));
         }
+    }
+}
 
-        let mut bytes = words.remainder().chunks_exact(8);
-        for chunk in bytes.by_ref() {
-            state.write_u8(chunk.load_be::<u8>());
+impl Tibs {
+    /// n concatenations of self, the implementation of __mul__ for both Tibs and Mutibs.
+    pub(crate) fn repeat(&self, n: i64) -> PyResult<Tibs> {
+        if n < 0 {
+            return Err(PyValueError::new_err(
+                "Cannot multiply by a negative integer.",
+            ));
         }
-
-        let tail = bytes.remainder();
-        if !tail.is_empty() {
-            let mut last = 0u8;
-            for bit in tail {
-                last = (last << 1) | (*bit as u8);
+        let n = n as usize;
+        let len = self.len();
+        if n == 0 || len == 0 {
+            return Ok(BitCollection::empty());
+        }
+        if len % 8 == 0 {
+            if let bitvec::domain::Domain::Region {
+                head: None,
+                body,
+                tail: None,
+            } = self.data.domain()
+            {
+                // Whole bytes, so the raw buffer can be repeated directly.
+                return Ok(Tibs::new(BV::from_vec(body.repeat(n))));
+            }
+        }
+        // Join just enough copies to end on a byte boundary (at most eight), repeat that block of
+        // whole bytes, then join on any copies left over. The copy is only there to guarantee the
+        // canonical layout that append_bits needs, as the inner Tibs of a Mutibs may not have it.
+        let source = Tibs::new(self.data.clone());
+        let raw = source.data.as_raw_slice();
+        let per_block = 8 >> len.trailing_zeros().min(3);
+        let total_len = len * n;
+        let mut bytes = Vec::with_capacity(total_len.div_ceil(8));
+        let mut joined_len = 0;
+        for _ in 0..per_block.min(n) {
+            append_bits(&mut bytes, joined_len, raw, len);
+            joined_len += len;
+        }
+        if n > per_block {
+            bytes = bytes.repeat(n / per_block);
+            joined_len *= n / per_block;
+            for _ in 0..n % per_block {
+                append_bits(&mut bytes, joined_len, raw, len);
+                joined_len += len;
             }
-            last <<= 8 - tail.len();
-            state.write_u8(last);
         }
+        let mut bv = BV::from_vec(bytes);
+        bv.truncate(total_len);
+        Ok(Tibs::new(bv))
     }
-}
 
-impl Tibs {
     pub(crate) fn _getslice_with_step(
         &self,
         start_bit: i64,
@@ -222,23 +339,7 @@ impl Tibs {
 
     /// Return string representations for printing.
     pub fn __str__(&self) -> String {
-        if self.is_empty() {
-            return "".to_string();
-        }
-        const MAX_BITS_TO_PRINT: usize = 10000;
-        debug_assert!(MAX_BITS_TO_PRINT % 4 == 0);
-        if self.len() <= MAX_BITS_TO_PRINT {
-            match self.to_hexadecimal() {
-                Ok(hex) => format!("0x{}", hex),
-                Err(_) => format!("0b{}", self.to_bin()),
-            }
-        } else {
-            format!(
-                "0x{}... # length={}",
-                self.slice(0, MAX_BITS_TO_PRINT).to_hexadecimal().unwrap(),
-                self.len()
-            )
-        }
+        self.build_str(true)
     }
 
     /// Return representation that could be used to recreate the instance.
@@ -330,14 +431,21 @@ impl Tibs {
     ///
     pub fn __eq__(&self, other: &Bound<'_, PyAny>) -> bool {
         if let Ok(b) = other.extract::<PyRef<Tibs>>() {
-            return self.data == b.data;
+            return self.eq_canonical(&b);
         }
         if let Ok(b) = other.extract::<PyRef<Mutibs>>() {
-            return self.data == b.inner.data;
+            return eq_bits(&self.data, &b.inner.data);
+        }
+        if let Ok(s) = other.cast::<PyString>() {
+            if let Ok(s) = s.to_cow() {
+                if let Some(equal) = eq_string_literal(&self.data, &s) {
+                    return equal;
+                }
+            }
         }
         let maybe = tibs_from_any(other.clone());
         match maybe {
-            Ok(b) => self.data == b.data,
+            Ok(b) => self.eq_canonical(&b),
             Err(_) => false,
         }
     }
@@ -362,9 +470,12 @@ impl Tibs {
 
     #[pyo3(name = "__hash__")]
     pub fn __hash__(&self) -> isize {
-        let mut hasher = DefaultHasher::new();
-        self.hash(&mut hasher);
-        hasher.finish() as isize
+        // The data can't change, so the hash only needs calculating once.
+        *self.hash_cache.get_or_init(|| {
+            let mut hasher = DefaultHasher::new();
+            self.hash(&mut hasher);
+            hasher.finish() as isize
+        })
     }
 
     #[pyo3(signature = (b, start=None, end=None, byte_aligned=false))]
@@ -376,17 +487,70 @@ impl Tibs {
         byte_aligned: bool,
         py: Python,
     ) -> PyResult<Py<FindAllIterator>> {
-        let b = tibs_from_any(b.bind(py).clone())?;
+        // A Tibs needle can be shared with the iterator rather than copied.
+        let b = b.bind(py);
+        let needle: Py<Tibs> = match b.cast::<Tibs>() {
+            Ok(bits) => bits.clone().unbind(),
+            Err(_) => Py::new(py, tibs_from_any(b.clone())?)?,
+        };
         let (start, end) = validate_slice(slf.len(), start, end)?;
         let step = if byte_aligned { 8 } else { 1 };
+        let table = search_table(needle.get());
         let iter_obj = FindAllIterator {
             haystack: slf.into(),
-            needle: Py::new(py, b)?,
+            needle,
             start,
             end,
             byte_aligned,
             step,
             current_pos: start,
+            table,
+            pending: VecDeque::new(),
+            batch: 1,
+        };
+        Py::new(py, iter_obj)
+    }
+
+    /// Return an iterator over the positions of the bits, starting from the end and working back.
+    ///
+    /// The positions are those from find_all in reverse order, but found lazily, so stopping
+    /// early doesn't need the earlier matches to have been searched for.
+    ///
+    /// :param b: The bits to search for.
+    /// :param start: The bit position to start the search. Defaults to 0.
+    /// :param end: The bit position one past the last bit to search. Defaults to len(self).
+    /// :param byte_aligned: If ``True``, only consider byte-aligned positions.
+    /// :return: An iterator of bit positions.
+    ///
+    /// .. code-block:: pycon
+    ///
+    ///     >>> list(Tibs('0b0101101').rfind_all('0b1'))
+    ///     [6, 4, 3, 1]
+    ///
+    #[pyo3(signature = (b, start=None, end=None, byte_aligned=false))]
+    pub fn rfind_all(
+        slf: PyRef<'_, Self>,
+        b: Py<PyAny>,
+        start: Option<i64>,
+        end: Option<i64>,
+        byte_aligned: bool,
+        py: Python,
+    ) -> PyResult<Py<RFindAllIterator>> {
+        let b = b.bind(py);
+        let needle: Py<Tibs> = match b.cast::<Tibs>() {
+            Ok(bits) => bits.clone().unbind(),
+            Err(_) => Py::new(py, tibs_from_any(b.clone())?)?,
+        };
+        let (start, end) = validate_slice(slf.len(), start, end)?;
+        let iter_obj = RFindAllIterator {
+            haystack: slf.into(),
+            needle,
+            start,
+            byte_aligned,
+            step: if byte_aligned { 8 } else { 1 },
+            current_end: end,
+            pending: VecDeque::new(),
+            batch: 1,
         };
         Py::new(py, iter_obj)
     }
@@ -406,14 +570,14 @@ impl Tibs {
     ///     a = Tibs.from_zeros(500)  # 500 zero bits
     ///
     #[classmethod]
-    pub fn from_zeros(_cls: &Bound<'_, PyType>, length: i64) -> PyResult<Self> {
+    pub fn from_zeros(cls: &Bound<'_, PyType>, length: i64) -> PyResult<Py<Self>> {
         if length < 0 {
             return Err(PyValueError::new_err(format!(
                 "Negative bit length given: {}.",
                 length
             )));
         }
-        Ok(BitCollection::from_zeros(length as usize))
+        cached_zeros(cls.py(), length as usize)
     }
 
     /// Create a new instance with all bits set to '1'.
@@ -426,14 +590,20 @@ impl Tibs {
     ///     Tibs('0b11111')
     ///
     #[classmethod]
-    pub fn from_ones(_cls: &Bound<'_, PyType>, length: i64) -> PyResult<Self> {
+    pub fn from_ones(cls: &Bound<'_, PyType>, length: i64) -> PyResult<Py<Self>> {
         if length < 0 {
             return Err(PyValueError::new_err(format!(
                 "Negative bit length given: {}.",
                 length
             )));
         }
-        Ok(BitCollection::from_ones(length as usize))
+        if length == 0 {
+            return cached_zeros(cls.py(), 0);
+        }
+        Py::new(
+            cls.py(),
+            <Tibs as BitCollection>::from_ones(length as usize),
+        )
     }
 
     /// Create a new instance from a formatted string.
@@ -456,8 +626,8 @@ impl Tibs {
     ///     a = Tibs("0xff01")  # Tibs(s) is equivalent to Tibs.from_string(s)
     ///
     #[classmethod]
-    pub fn from_string(_cls: &Bound<'_, PyType>, s: String) -> PyResult<Self> {
-        str_to_tibs(s)
+    pub fn from_string(cls: &Bound<'_, PyType>, s: String) -> PyResult<Py<Self>> {
+        cached_small(cls.py(), str_to_tibs(s)?)
     }
 
     #[classmethod]
@@ -518,16 +688,18 @@ impl Tibs {
     ///     a = Tibs.from_bools([False, 0, 1, "Steven"])  # binary 0011
     ///
     #[classmethod]
-    pub fn from_bools(
-        _cls: &Bound<'_, PyType>,
-        values: Vec<Py<PyAny>>,
-        py: Python,
-    ) -> PyResult<Self> {
-        let mut bv = BV::with_capacity(values.len());
-
-        for value in values {
-            let b = value.is_truthy(py)?;
-            bv.push(b);
+    pub fn from_bools(_cls: &Bound<'_, PyType>, values: &Bound<'_, PyAny>) -> PyResult<Self> {
+        if values.is_instance_of::<PyString>() {
+            return Err(PyTypeError::new_err(
+                "Can't create from a str with from_bools(). Perhaps you want from_string()?",
+            ));
+        }
+        if let Some(buffer) = single_byte_buffer(values) {
+            return Ok(Tibs::new(pack_bools(buffer.as_bytes())));
+        }
+        let mut bv = BV::with_capacity(values.len().unwrap_or(0));
+        for value in values.try_iter()? {
+            bv.push(value?.is_truthy()?);
         }
         Ok(Tibs::new(bv))
     }
@@ -565,15 +737,11 @@ impl Tibs {
         }
         let seed_arr = crate::helpers::process_seed(seed);
         let mut rng = StdRng::from_seed(seed_arr);
-        let mut bv = BV::with_capacity(length);
 
-        let num_bytes = (length + 7) / 8;
-        let mut data = Vec::<u8>::with_capacity(num_bytes);
-        unsafe {
-            data.set_len(num_bytes);
-        }
+        // Fill whole bytes in one call. Tibs::new clears the unused bits of the final byte.
+        let mut data = vec![0u8; length.div_ceil(8)];
         rng.fill_bytes(&mut data);
-        bv = BV::from_vec(data);
+        let mut bv = BV::from_vec(data);
         bv.truncate(length);
         Ok(Tibs::new(bv))
     }
@@ -610,19 +778,24 @@ impl Tibs {
         let iter = sequence.try_iter()?;
         let mut parts: Vec<Tibs> = Vec::new();
         let mut total_len: usize = 0;
+        let mut previous_str: Option<Bound<'_, PyAny>> = None;
         for item in iter {
             let obj = item?;
-            let bits = tibs_from_any(obj.into())?;
+            // Strings are immutable, so one repeated in the sequence (e.g. ['0b01'] * n) is only parsed once.
+            let bits = match (&previous_str, parts.last()) {
+                (Some(prev), Some(last)) if obj.is(prev) => last.clone(),
+                _ => tibs_from_any(obj.clone())?,
+            };
+            previous_str = if obj.is_instance_of::<PyString>() {
+                Some(obj)
+            } else {
+                None
+            };
             total_len += bits.len();
             parts.push(bits);
         }
 
-        // Concatenate.
-        let mut bv = BV::with_capacity(total_len);
-        for bits in &parts {
-            bv.extend_from_bitslice(&bits.data);
-        }
-        Ok(Tibs::new(bv))
+        Ok(Tibs::join(&parts, total_len))
     }
 
     /// Return bytes that can easily be converted to an int in Python
@@ -630,20 +803,18 @@ impl Tibs {
         if self.is_empty() {
             return Vec::new();
         }
-
-        // TODO: Is this next line right?
-        let needed_bits = (self.len() + 7) & !7;
-        let mut bv = BV::with_capacity(needed_bits);
-
-        let sign_bit = signed && self.data[0];
-        let padding = needed_bits - self.len();
-
-        for _ in 0..padding {
-            bv.push(sign_bit);
+        // Right-justify the bits in whole bytes, with any padding at the front filled with the sign bit.
+        let mut bytes = self.to_bytes();
+        let padding = bytes.len() * 8 - self.len();
+        if padding != 0 {
+            let mut carry: u8 = if signed && self.data[0] { 0xff } else { 0 };
+            for byte in bytes.iter_mut() {
+                let b = *byte;
+                *byte = (carry << (8 - padding)) | (b >> padding);
+                carry = b;
+            }
         }
-        bv.extend_from_bitslice(&self.data);
-
-        bv.into_vec()
+        bytes
     }
 
     /// Return the Tibs as bytes, padding with zero bits if needed.
@@ -720,20 +891,17 @@ impl Tibs {
 
     pub fn _and(&self, other: &Tibs) -> PyResult<Self> {
         validate_logical_op_lengths(self.len(), other.len())?;
-        let result = self.data.clone() & &other.data;
-        Ok(Tibs::new(result))
+        Ok(self.logical_and(other))
     }
 
     pub fn _or(&self, other: &Tibs) -> PyResult<Self> {
         validate_logical_op_lengths(self.len(), other.len())?;
-        let result = self.data.clone() | &other.data;
-        Ok(Tibs::new(result))
+        Ok(self.logical_or(other))
     }
 
     pub fn _xor(&self, other: &Tibs) -> PyResult<Self> {
         validate_logical_op_lengths(self.len(), other.len())?;
-        let result = self.data.clone() ^ &other.data;
-        Ok(Tibs::new(result))
+        Ok(self.logical_xor(other))
     }
 
     #[pyo3(signature = (b, start=None, end=None, byte_aligned=false))]
@@ -745,20 +913,48 @@ impl Tibs {
         byte_aligned: bool,
         py: Python,
     ) -> PyResult<Option<usize>> {
-        let b = tibs_from_any(b.bind(py).clone())?;
-        if b.is_empty() {
-            return Err(PyValueError::new_err("No bits were provided to find."));
-        }
-        let (start, end) = validate_slice(self.len(), start, end)?;
-
-        Ok(find_bitvec(self, &b, start, end, byte_aligned))
+        with_tibs(b.bind(py), |b| {
+            if b.is_empty() {
+                return Err(PyValueError::new_err("No bits were provided to find."));
+            }
+            let (start, end) = validate_slice(self.len(), start, end)?;
+            Ok(find_bitvec(self, b, start, end, byte_aligned))
+        })
     }
 
     pub fn __contains__(&self, b: Py<PyAny>, py: Python) -> bool {
-        match self.find(b, None, None, false, py) {
-            Ok(Some(_)) => true,
-            _ => false,
+        // Searches directly rather than through find, so there's no slice to validate and
+        // anything that can't be found (including empty or unconvertible needles) is just False.
+        with_tibs(b.bind(py), |b| {
+            Ok(!b.is_empty() && find_bitvec(self, b, 0, self.len(), false).is_some())
+        })
+        .unwrap_or(false)
+    }
+
+    /// Return a dict mapping each of the needles to whether it is found in the Tibs.
+    ///
+    /// This gives the same results as ``{n: n in s for n in needles}``, but searches the Tibs
+    /// once for all the needles of up to 64 bits rather than once per needle.
+    ///
+    /// :param needles: An iterable of objects that can be converted to a Tibs, and that can be used as dict keys.
+    /// :return: A dict with a bool value for each needle.
+    ///
+    /// .. code-block:: python
+    ///
+    ///     s = Tibs('0x0001dead0001')
+    ///     s.contains_any(['0xdead', '0xbeef'])  # {'0xdead': True, '0xbeef': False}
+    ///
+    pub fn contains_any<'py>(&self, needles: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyDict>> {
+        let keys: Vec<Bound<'py, PyAny>> = needles.try_iter()?.collect::<PyResult<_>>()?;
+        let parts: Vec<Tibs> = keys
+            .iter()
+            .map(|k| tibs_from_any(k.clone()))
+            .collect::<PyResult<_>>()?;
+        let result = PyDict::new(needles.py());
+        for (key, found) in keys.iter().zip(contains_each(self, &parts)) {
+            result.set_item(key, found)?;
         }
+        Ok(result)
     }
 
     #[pyo3(signature = (b, start=None, end=None, byte_aligned=false))]
@@ -770,30 +966,13 @@ impl Tibs {
         byte_aligned: bool,
         py: Python,
     ) -> PyResult<Option<usize>> {
-        let b = tibs_from_any(b.bind(py).clone())?;
-        if b.is_empty() {
-            return Err(PyValueError::new_err("No bits were provided to rfind."));
-        }
-
-        let (start, end) = validate_slice(self.len(), start, end)?;
-        if b.len() + start > end {
-            return Ok(None);
-        }
-        let step = if byte_aligned { 8 } else { 1 };
-        let mut pos = end - b.len();
-        if byte_aligned {
-            pos = pos / 8 * 8;
-        }
-        while pos >= start {
-            if &self.data[pos..pos + b.len()] == &b.data {
-                return Ok(Some(pos));
+        with_tibs(b.bind(py), |b| {
+            if b.is_empty() {
+                return Err(PyValueError::new_err("No bits were provided to rfind."));
             }
-            if pos < step {
-                break;
-            }
-            pos -= step;
-        }
-        Ok(None)
+            let (start, end) = validate_slice(self.len(), start, end)?;
+            Ok(rfind_bitvec(&self.data, &b.data, start, end, byte_aligned))
+        })
     }
 
     /// Return whether the current Tibs starts with prefix.
@@ -809,13 +988,9 @@ impl Tibs {
     ///     False
     ///
     pub fn starts_with(&self, prefix: Py<PyAny>, py: Python) -> PyResult<bool> {
-        let prefix = tibs_from_any(prefix.bind(py).clone())?;
-        let n = prefix.len();
-        if n <= self.len() {
-            Ok(&prefix.data == &self.data[..n])
-        } else {
-            Ok(false)
-        }
+        with_tibs(prefix.bind(py), |prefix| {
+            Ok(matches_at(&self.data, 0, &prefix.data))
+        })
     }
 
     /// Return whether the current Tibs ends with suffix.
@@ -831,13 +1006,12 @@ impl Tibs {
     ///     False
     ///
     pub fn ends_with(&self, suffix: Py<PyAny>, py: Python) -> PyResult<bool> {
-        let suffix = tibs_from_any(suffix.bind(py).clone())?;
-        let n = suffix.len();
-        if n <= self.len() {
-            Ok(&suffix.data == &self.data[self.len() - n..])
-        } else {
-            Ok(false)
-        }
+        with_tibs(suffix.bind(py), |suffix| {
+            Ok(match self.len().checked_sub(suffix.len()) {
+                Some(start) => matches_at(&self.data, start, &suffix.data),
+                None => false,
+            })
+        })
     }
 
     /// Return count of total number of either zero or one bits.
@@ -851,28 +1025,9 @@ impl Tibs {
     ///         7
     ///
     pub fn count(&self, value: Py<PyAny>, py: Python) -> PyResult<usize> {
-        let count_ones = value.is_truthy(py)?;
-        let len = self.len();
-
-        let (mut ones, raw) = (0usize, self.data.as_raw_slice());
-        if let Ok(words) = bytemuck::try_cast_slice::<u8, usize>(raw) {
-            // Considerable speed increase by casting data to usize if possible.
-            for word in words {
-                ones += word.count_ones() as usize;
-            }
-            let used_bits = words.len() * usize::BITS as usize;
-            if used_bits > len {
-                let extra = used_bits - len;
-                if let Some(last) = words.last() {
-                    ones -= ((last & (!0usize >> extra)).count_ones()) as usize;
-                }
-            }
-        } else {
-            // Fallback to library method
-            ones = self.data.count_ones();
-        }
-
-        Ok(if count_ones { ones } else { len - ones })
+        let count_set = value.is_truthy(py)?;
+        let ones = count_ones(&self.data);
+        Ok(if count_set { ones } else { self.len() - ones })
     }
 
     /// Return a slice of the current Tibs.
@@ -920,6 +1075,11 @@ impl Tibs {
         self.data.any()
     }
 
+    /// Return the Tibs itself for the copy module. As it is immutable no copy is needed.
+    pub fn __copy__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
     /// Create and return a mutable copy of the Tibs as a Mutibs instance.
     pub fn to_mutibs(&self) -> Mutibs {
         Mutibs {
@@ -935,24 +1095,33 @@ impl Tibs {
     }
 
     #[inline]
-    pub fn __getitem__(&self, key: &Bound<'_, PyAny>) -> PyResult<Py<PyAny>> {
+    pub fn __getitem__(slf: PyRef<'_, Self>, key: &Bound<'_, PyAny>) -> PyResult<Py<PyAny>> {
         let py = key.py();
         // Handle integer indexing
         if let Ok(index) = key.extract::<i64>() {
-            let value: bool = self._getindex(index)?;
+            let value: bool = slf._getindex(index)?;
             let py_value = PyBool::new(py, value);
             return Ok(py_value.to_owned().into());
         }
 
         // Handle slice indexing
         if let Ok(slice) = key.cast::<PySlice>() {
-            let indices = slice.indices(self.len() as isize)?;
+            let indices = slice.indices(slf.len() as isize)?;
             let start: i64 = indices.start.try_into()?;
             let stop: i64 = indices.stop.try_into()?;
             let step: i64 = indices.step.try_into()?;
 
+            // Tibs are immutable, so a slice of everything can be the same object, and an
+            // empty slice can be the shared empty Tibs.
+            if step == 1 && start == 0 && stop == slf.len() as i64 {
+                let this: Py<Self> = slf.into();
+                return Ok(this.into_any());
+            }
+            if indices.slicelength == 0 {
+                return Ok(cached_zeros(py, 0)?.into_any());
+            }
             let result = if step == 1 {
-                self._getslice(
+                slf._getslice(
                     start as usize,
                     if stop > start {
                         (stop - start) as usize
@@ -961,7 +1130,7 @@ impl Tibs {
                     },
                 )?
             } else {
-                self._getslice_with_step(start, stop, step)?
+                slf._getslice_with_step(start, stop, step)?
             };
             let py_obj = Py::new(py, result)?.into_pyobject(py)?;
             return Ok(py_obj.into());
@@ -1021,17 +1190,13 @@ impl Tibs {
     /// Concatenates two Tibs and return a newly constructed Tibs.
     pub fn __add__(&self, bs: Py<PyAny>, py: Python) -> PyResult<Self> {
         let bs = tibs_from_any(bs.bind(py).clone())?;
-        let mut data = BV::with_capacity(self.len() + bs.len());
-        data.extend_from_bitslice(&self.data);
-        data.extend_from_bitslice(&bs.data);
-        Ok(Tibs::new(data))
+        Ok(Tibs::join([self, &bs], self.len() + bs.len()))
     }
 
     /// Concatenates two Tibs and return a newly constructed Tibs.
     pub fn __radd__(&self, bs: Py<PyAny>, py: Python) -> PyResult<Self> {
-        let mut bs = mutibs_from_any(bs.bind(py).clone())?;
-        bs.inner.data.extend_from_bitslice(&self.data);
-        Ok(Tibs::new(bs.inner.data))
+        let bs = tibs_from_any(bs.bind(py).clone())?;
+        Ok(Tibs::join([&bs, self], bs.len() + self.len()))
     }
 
     /// Bit-wise 'and' between two Tibs. Returns new Tibs.
@@ -1104,11 +1269,25 @@ impl Tibs {
         if self.data.is_empty() {
             return Err(PyValueError::new_err("Cannot invert empty Tibs."));
         }
-        Ok(Tibs::new(self.data.clone().not()))
+        Ok(self.inverted())
     }
 
-    pub fn __bytes__(&self) -> Vec<u8> {
-        self.to_bytes()
+    pub fn __bytes__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        match self.data.as_bitslice().domain() {
+            // Element-aligned: write straight into the new bytes object, masking any final partial byte.
+            bitvec::domain::Domain::Region {
+                head: None,
+                body,
+                tail,
+            } => PyBytes::new_with(py, body.len() + tail.is_some() as usize, |buf| {
+                buf[..body.len()].copy_from_slice(body);
+                if let Some(partial) = tail {
+                    buf[body.len()] = partial.load_value();
+                }
+                Ok(())
+            }),
+            _ => Ok(PyBytes::new(py, &self.to_bytes())),
+        }
     }
 
     /// Return new Tibs consisting of n concatenations of self.
@@ -1117,24 +1296,16 @@ impl Tibs {
     ///
     /// n -- The number of concatenations. Must be >= 0.
     ///
-    pub fn __mul__(&self, n: i64) -> PyResult<Self> {
-        if n < 0 {
-            return Err(PyValueError::new_err(
-                "Cannot multiply by a negative integer.",
-            ));
-        }
-        let n = n as usize;
-        let len = self.len();
-        if n == 0 || len == 0 {
-            return Ok(BitCollection::empty());
+    pub fn __mul__(slf: PyRef<'_, Self>, n: i64) -> PyResult<Py<Self>> {
+        let py = slf.py();
+        if n == 1 {
+            return Ok(slf.into());
         }
-        let mut bv = BV::with_capacity(len * n);
-        bv.extend_from_bitslice(&self.data);
-        // TODO: This could be done more efficiently with doubling.
-        for _ in 1..n {
-            bv.extend_from_bitslice(&self.data);
+        let result = slf.repeat(n)?;
+        if result.is_empty() {
+            return cached_zeros(py, 0);
         }
-        Ok(Tibs::new(bv))
+        Py::new(py, result)
     }
 
     /// Return Tibs consisting of n concatenations of self.
@@ -1143,8 +1314,8 @@ impl Tibs {
     ///
     /// n -- The number of concatenations. Must be >= 0.
     ///
-    pub fn __rmul__(&self, n: i64) -> PyResult<Self> {
-        self.__mul__(n)
+    pub fn __rmul__(slf: PyRef<'_, Self>, n: i64) -> PyResult<Py<Self>> {
+        Tibs::__mul__(slf, n)
     }
 
     pub fn __setitem__(&self, _key: Py<PyAny>, _value: Py<PyAny>) -> PyResult<()> {
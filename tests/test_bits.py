@@ -1,15 +1,31 @@
 #!/usr/bin/env python
+from hashlib import blake2b
+import operator
 import pytest
 import re
-from hypothesis import given
+from hypothesis import given, settings
 import hypothesis.strategies as st
 from tibs import Tibs, Mutibs
 from typing import Iterable, Sequence
 
 
+_COLOUR_ESCAPE = re.compile(r"(?:\x1B[@-_])[0-?]*[ -/]*[@-~]")
+
+
+_B0 = Tibs.from_string("0b0")
+_B1 = Tibs.from_string("0b1")
+_B11 = Tibs.from_string("0b11")
+_B000111 = Tibs.from_string("0b000111")
+_FF = Tibs.from_string("0xff")
+_ZZ = Tibs.from_string("0x00")
+# "0b000111" * 10, left-aligned in eight bytes.
+_PATTERN_60 = (int("000111" * 10, 2) << 4).to_bytes(8, "big")
+
+
 def remove_unprintable(s: str) -> str:
-    colour_escape = re.compile(r"(?:\x1B[@-_])[0-?]*[ -/]*[@-~]")
-    return colour_escape.sub("", s)
+    if "\x1b" not in s:
+        return s
+    return _COLOUR_ESCAPE.sub("", s)
 
 
 class TestCreation:
@@ -17,10 +33,12 @@ class TestCreation:
         s = Tibs.from_bytes(b"\xa0\xff")
         assert (len(s), s.to_hex()) == (16, "a0ff")
 
-    @given(st.binary())
-    def test_creation_from_bytes_roundtrip(self, data):
-        s = Tibs.from_bytes(data)
-        assert s.to_bytes() == data
+    @settings(max_examples=25, derandomize=True, database=None, deadline=None)
+    @given(st.lists(st.binary(), min_size=32, max_size=128))
+    def test_creation_from_bytes_roundtrip(self, batch):
+        out = [Tibs.from_bytes(data).to_bytes() for data in batch]
+        assert [len(b) for b in out] == [len(b) for b in batch]
+        assert b"".join(out) == b"".join(batch)
 
     def test_creation_from_hex(self):
         s = Tibs.from_hex("0xA0ff")
@@ -39,11 +57,35 @@ class TestInitialisation:
         r = a.find("0x23462346246", byte_aligned=True)
         assert r is None
 
+    @pytest.mark.parametrize(
+        "nbytes, needle", [(1 << 10, "0xab"), (1 << 20, "0xabcd"), (1 << 20, "0xdeadbeef")]
+    )
+    def test_find_byte_aligned_large(self, nbytes, needle):
+        needle_bytes = Tibs(needle).to_bytes()
+        # The filler is full of near misses that share all but the last byte of the needle.
+        decoy = needle_bytes[:-1] + b"\x00"
+        filler = (decoy * (nbytes // len(decoy) + 1))[: nbytes - len(needle_bytes)]
+        a = Tibs.from_bytes(filler + needle_bytes)
+        assert a.find(needle, byte_aligned=True) == len(filler) * 8
+        assert a.rfind(needle, byte_aligned=True) == len(filler) * 8
+        assert a[:-8].find(needle, byte_aligned=True) is None
+
     def test_rfind(self):
         a = Tibs.from_string("0b11101010010010")
         b = a.rfind("0b010")
         assert b == 11
 
+    def test_find_pathological(self):
+        n = 1 << 16
+        hay = Tibs.from_bytes(b"a" * n + b"b")
+        assert hay.find("0x62", byte_aligned=True) == n * 8
+        assert hay.find(Tibs.from_bytes(b"a" * 1000 + b"b"), byte_aligned=True) == (n - 1000) * 8
+        hay = Tibs.from_bytes(b"b" + b"a" * n)
+        assert hay.rfind(Tibs.from_bytes(b"b" + b"a" * 1000), byte_aligned=True) == 0
+        hay = Tibs.from_zeros(n) + "0b1"
+        assert hay.find("0b" + "0" * 40 + "1") == n - 40
+        assert hay.rfind("0b" + "0" * 40 + "1") == n - 40
+
     def test_find_all(self):
         a = Tibs("0b0010011")
         b = list(a.find_all('0b1'))
@@ -55,22 +97,30 @@ class TestInitialisation:
 
 class TestCut:
     def test_cut(self):
-        s = Tibs().from_joined(["0b000111"] * 10)
+        s = Tibs.from_bytes(_PATTERN_60)[:60]
         for t in s.chunks(6):
-            assert t == "0b000111"
+            assert t == _B000111
 
+    def test_joined_repeated_string(self):
+        assert Tibs.from_joined(["0b000111"] * 10) == Tibs.from_bytes(_PATTERN_60)[:60]
+        assert Tibs.from_joined(["0b1", "0b1", b"\x00", "0b1"]) == "0b11000000001"
 
-def test_unorderable():
-    a = Tibs("0b000111")
-    b = Tibs("0b000111")
-    with pytest.raises(TypeError):
-        _ = a < b
-    with pytest.raises(TypeError):
-        _ = a > b
-    with pytest.raises(TypeError):
-        _ = a <= b
+    def test_joined_byte_then_bit_pieces(self):
+        s = Tibs.from_joined(["0xff", b"\x01", "0b101", "0x0f", "0b1"])
+        assert s == "0b1111111100000001101000011111"
+
+    def test_joined_unaligned_pieces(self):
+        pieces = [format(i, "b") * (i % 5) for i in range(1, 100)]
+        s = Tibs.from_joined("0b" + p for p in pieces if p)
+        assert s.to_bin() == "".join(pieces)
+        assert Tibs.from_joined([s, "0b1", s]).to_bin() == s.to_bin() + "1" + s.to_bin()
+
+
+@pytest.mark.parametrize("op", [operator.lt, operator.le, operator.gt, operator.ge])
+@pytest.mark.parametrize("a, b", [(_B000111, _B000111), (_B0, _B1)])
+def test_unorderable(op, a, b):
     with pytest.raises(TypeError):
-        _ = a >= b
+        op(a, b)
 
 
 class TestPadToken:
@@ -92,14 +142,26 @@ class TestPadToken:
 
 
 def test_adding():
-    a = Tibs.from_string("0b0")
-    b = Tibs.from_string("0b11")
+    a = _B0
+    b = _B11
     c = a + b
     assert c == "0b011"
     assert a == "0b0"
     assert b == "0b11"
 
 
+def test_adding_unaligned():
+    a = Tibs.from_string("0b101")
+    b = Tibs.from_string("0xf0f, 0b1")
+    assert a + b == "0b101, 0xf0f, 0b1"
+    assert "0b0" + a == "0b0101"
+    assert b"\xff" + a == "0xff, 0b101"
+    s = Tibs()
+    for _ in range(10):
+        s = a + s
+    assert s == "0b101" * 10
+
+
 class TestContainsBug:
     def test_contains(self):
         a = Tibs.from_string("0b1, 0x0001dead0001")
@@ -109,6 +171,15 @@ class TestContainsBug:
         assert "0b1" in Tibs.from_string("0xf")
         assert "0b0" not in Tibs.from_string("0xf")
 
+    def test_contains_batch(self):
+        hay = Tibs.from_string("0b1, 0x0001dead0001")
+        hits = hay.contains_any(["0xdead", "0xfeed", "0xbeef"])
+        assert hits == {"0xdead": True, "0xfeed": False, "0xbeef": False}
+        hay = Tibs.from_string("0xdeadbeef" * 3)
+        long_needle = hay[4:90]
+        hits = hay.contains_any([long_needle, "0b1", Tibs(), "0x" + "0" * 20])
+        assert hits == {long_needle: True, "0b1": True, Tibs(): False, "0x" + "0" * 20: False}
+
 
 class TestUnderscoresInLiterals:
     def test_hex_creation(self):
@@ -129,6 +200,18 @@ class TestUnderscoresInLiterals:
         b = Tibs.from_string("0o123_321_123_321")
         assert b.to_oct() == "123321123321"
 
+    @given(st.text(alphabet="0123456789abcdefABCDEF_", max_size=64))
+    def test_hex_underscore_strip(self, s):
+        assert Tibs.from_hex(s).to_hex() == s.replace("_", "").lower()
+
+    @given(st.text(alphabet="01_", max_size=64))
+    def test_binary_underscore_strip(self, s):
+        assert Tibs.from_bin(s).to_bin() == s.replace("_", "")
+
+    @given(st.text(alphabet="01234567_", max_size=64))
+    def test_octal_underscore_strip(self, s):
+        assert Tibs.from_oct(s).to_oct() == s.replace("_", "")
+
 
 def test_from_iterable():
     with pytest.raises(TypeError):
@@ -139,6 +222,12 @@ def test_from_iterable():
     assert a == "0b1011"
     a = Tibs.from_bools((True,))
     assert a.to_bin() == "1"
+    assert Tibs.from_bools(b"\x01\x00\x02\xff") == "0b1011"
+    assert Tibs.from_bools(bytearray(9)) == Tibs.from_zeros(9)
+    assert Tibs.from_bools(memoryview(b"\x00\x01" * 5)) == "0b0101010101"
+    assert Tibs.from_bools(x > 2 for x in range(5)) == "0b00011"
+    with pytest.raises(TypeError):
+        _ = Tibs.from_bools("0b101")
 
 
 def test_mul_by_zero():
@@ -149,13 +238,16 @@ def test_mul_by_zero():
     assert b == a
     b = a * 2
     assert b == a + a
+    assert a * 0 is Tibs.from_zeros(0) is Tibs.from_ones(0) is 0 * a
+    assert Tibs() * 3 is Tibs.from_zeros(0)
+    assert a * 1 is a
 
 
 def test_from_ones():
     a = Tibs.from_ones(0)
     assert a == Tibs()
     a = Tibs.from_ones(1)
-    assert a == Tibs("0b1")
+    assert a == _B1
     with pytest.raises(ValueError):
         _ = Tibs.from_ones(-1)
 
@@ -164,9 +256,12 @@ def test_from_zeros():
     a = Tibs.from_zeros(0)
     assert a == Tibs()
     a = Tibs.from_zeros(1)
-    assert a == Tibs("0b0")
+    assert a == _B0
     with pytest.raises(ValueError):
         _ = Tibs.from_zeros(-1)
+    assert Tibs.from_zeros(10) is Tibs.from_zeros(10)
+    assert Tibs.from_zeros(1000) == Tibs.from_zeros(1000)
+    assert Mutibs.from_zeros(10) is not Mutibs.from_zeros(10)
 
 
 def test_bits_slicing():
@@ -174,16 +269,70 @@ def test_bits_slicing():
     b = a[-5:-8:1]
     assert b == Tibs()
 
-    assert a[::2] == '0xff'
-    assert a[1::2] == '0x00'
-
-
-def test_from_random():
+    assert a[::2] == _FF
+    assert a[1::2] == _ZZ
+    assert a[::2].to_bytes() == b'\xff'
+    assert a[1::2].to_bytes() == b'\x00'
+
+
+def test_whole_and_empty_slices_are_shared():
+    a = Tibs('0x0123456789abcdef')
+    assert a[:] is a
+    assert a[0:len(a)] is a
+    assert a[-len(a):] is a
+    assert a[::-1] == Tibs('0xf7b3d591e6a2c480')
+    assert a[5:5] is Tibs() * 0
+    assert a[10:2] is a[5:5]
+    assert a[::2][:] == a[::2]
+    m = Mutibs('0x0123')
+    assert m[:] == m
+    assert m[:] is not m
+    # Byte-aligned slices copy whole bytes, and the bits past the end must not leak in.
+    assert a[8:20] == '0x234'
+    assert a[8:20] + '0b1' == Tibs('0b0010001101001')
+    assert a[16:64] == '0x456789abcdef'
+
+
+def test_small_from_string_are_shared():
+    assert Tibs.from_string('0b1') is Tibs.from_string('0b1')
+    assert Tibs.from_string('0xab') is Tibs.from_string('0b10101011')
+    assert Tibs.from_string('0b0') is Tibs.from_zeros(1)
+    assert Tibs.from_string('0x00') is Tibs.from_zeros(8)
+    assert Tibs.from_string('0xab') != Tibs.from_string('0xac')
+    assert Tibs.from_string('0xab') == Tibs('0xab')
+    assert Tibs.from_string('0xabc') is not Tibs.from_string('0xabc')
+
+
+def _swar_even_bits(x: int) -> int:
+    """Gather the even-positioned bits (counting from the LSB) of a 64-bit int into 32 bits."""
+    x &= 0x5555555555555555
+    x = (x | (x >> 1)) & 0x3333333333333333
+    x = (x | (x >> 2)) & 0x0F0F0F0F0F0F0F0F
+    x = (x | (x >> 4)) & 0x00FF00FF00FF00FF
+    x = (x | (x >> 8)) & 0x0000FFFF0000FFFF
+    x = (x | (x >> 16)) & 0x00000000FFFFFFFF
+    return x
+
+
+@given(st.integers(0, (1 << 64) - 1))
+def test_stride_two_slicing_matches_swar(x):
+    a = Tibs.from_bytes(x.to_bytes(8, "big"))
+    # Bit 0 of a Tibs is the MSB, so a[::2] takes the odd LSB positions and a[1::2] the even ones.
+    assert a[::2].to_bytes() == _swar_even_bits(x >> 1).to_bytes(4, "big")
+    assert a[1::2].to_bytes() == _swar_even_bits(x).to_bytes(4, "big")
+
+
+@pytest.fixture(scope="module")
+def rand10k_aseed():
+    return Tibs.from_random(10000, b'a_seed')
+
+
+def test_from_random(rand10k_aseed):
     a = Tibs.from_random(0)
     assert a == Tibs()
     a = Tibs.from_random(1)
     assert a == '0b1' or a == '0b0'
-    a = Tibs.from_random(10000, b'a_seed')
+    a = rand10k_aseed
     b = Tibs.from_random(10000, b'a_seed')
     assert a == b
     b = Tibs.from_random(10000,
@@ -191,6 +340,22 @@ def test_from_random():
     assert a != b
     c = Mutibs.from_random(10000, b'a_seed')
     assert a == c
+    digest = lambda x: blake2b(x.to_bytes(), digest_size=16).digest()
+    assert digest(a) == digest(c)
+    # Cached hashes that differ short-circuit equality, so check both outcomes once hashes exist.
+    d = Tibs.from_random(10000, b'a_seed')
+    assert hash(a) == hash(d) and a == d
+    assert hash(a) != hash(b) and a != b
+
+
+@pytest.mark.parametrize("nbits", [0, 1, 64, 4096, 65536])
+@pytest.mark.parametrize("seed", [b"", b"a_seed", b"x" * 256])
+def test_from_random_determinism(nbits, seed):
+    a = Tibs.from_random(nbits, seed)
+    assert len(a) == nbits
+    assert a == Tibs.from_random(nbits, seed)
+    # The seeded generator is a stream, so shorter outputs are prefixes of longer ones.
+    assert a == Tibs.from_random(65536, seed)[:nbits]
 
 
 @pytest.mark.skip
@@ -216,12 +381,47 @@ def test_bool_conversion():
 
 def test_find_all():
     a = Tibs(' 0 B 0 0 01011')
-    g = a.find_all('0b1')
-    assert next(g) == 3
-    assert next(g) == 5
-    assert next(g) == 6
-    with pytest.raises(StopIteration):
-        _ = next(g)
+    assert list(a.find_all('0b1')) == [3, 5, 6]
+    assert list(a.find_all('0b0')) == [0, 1, 2, 4]
+    assert list(a.find_all('0b0', start=3, end=6)) == [4]
+
+
+def test_find_all_single_bits():
+    hay = Tibs.from_random(1 << 16, b'find_all') + '0b1'
+    b = hay.to_bin()
+    assert list(hay.find_all('0b1')) == [i for i, c in enumerate(b) if c == '1']
+    expected = [i for i, c in enumerate(b[:5000]) if c == '0' and i >= 100]
+    assert list(hay.find_all('0b0', start=100, end=5000)) == expected
+
+
+def test_find_all_partly_consumed():
+    hay = Tibs.from_ones(3000)
+    it = hay.find_all('0b11', byte_aligned=True)
+    assert [next(it) for _ in range(5)] == [0, 8, 16, 24, 32]
+    assert list(it) == list(range(40, 3000, 8))
+    assert next(it, None) is None
+    it = hay.find_all('0b1', start=2990)
+    assert list(zip(range(3), it)) == [(0, 2990), (1, 2991), (2, 2992)]
+    assert list(it) == list(range(2993, 3000))
+
+
+def test_find_all_long_needle_in_long_haystack():
+    needle = bytes(range(256))
+    hay = Tibs.from_bytes((needle + b'\xff' * 44) * 7000)
+    assert list(hay.find_all(needle, byte_aligned=True)) == [i * 2400 for i in range(7000)]
+    assert list(hay.find_all(needle[:-1] + b'\x00', byte_aligned=True)) == []
+
+
+def test_rfind_all():
+    a = Tibs(' 0 B 0 0 01011')
+    assert list(a.rfind_all('0b1')) == [6, 5, 3]
+    assert list(a.rfind_all('0b0', start=3, end=6)) == [4]
+    hay = Tibs.from_random(5000, b'rfind_all')
+    for needle, ba in [('0b1', False), ('0b101', False), ('0b11', True), ('0x0', True)]:
+        assert list(hay.rfind_all(needle, byte_aligned=ba)) == list(hay.find_all(needle, byte_aligned=ba))[::-1]
+    it = Tibs.from_ones(3000).rfind_all('0b11', start=5)
+    assert [next(it) for _ in range(3)] == [2998, 2997, 2996]
+    assert list(it)[-1] == 5
 
 
 def test_repr():
@@ -231,16 +431,3 @@ def test_repr():
     assert repr(a) == "Tibs()"
     a = Tibs(" 0b 1")
     assert repr(a) == "Tibs('0b1')"
-
-
-def test_bits_not_orderable():
-    a = Tibs.from_string("0b0")
-    b = Tibs.from_string("0b1")
-    with pytest.raises(TypeError):
-        _ = a < b
-    with pytest.raises(TypeError):
-        _ = a <= b
-    with pytest.raises(TypeError):
-        _ = a > b
-    with pytest.raises(TypeError):
-        _ = a >= b
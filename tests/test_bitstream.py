@@ -903,7 +903,6 @@ class TestManyDifferentThings:
         assert hash(a) == hash(b)
         assert hash(a) != hash(c)
 
-    @pytest.mark.skip
     def test_const_bits_copy(self):
         a = Tibs("0xabc")
         b = copy.copy(a)
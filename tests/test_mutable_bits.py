@@ -286,6 +286,17 @@ def test_invert():
     assert b == '0b0001'
     assert a == '0b1110'
 
+def test_strings_follow_mutation():
+    a = Mutibs('0xf')
+    assert a.to_hex() == 'f'
+    assert str(a) == '0xf'
+    a[0] = 0
+    assert a.to_hex() == '7'
+    assert a.to_bin() == '0111'
+    assert str(a) == '0x7'
+    t = a.to_tibs()
+    assert t.to_hex() == '7'
+
 @pytest.mark.skip
 def test_properties():
     a = Mutibs('0x0000')
@@ -390,6 +401,11 @@ def test_set_with_range():
     a = Mutibs('0b0000')
     a.set(1, range(4))
     assert a == '0b1111'
+    b = Mutibs.from_zeros(150)
+    b.set(1, range(3, 141))
+    assert b == Mutibs.from_joined(['0b000', Mutibs.from_ones(138), Mutibs.from_zeros(9)])
+    b.set(0, range(5, 140))
+    assert b == Mutibs.from_joined(['0b00011', Mutibs.from_zeros(135), '0b1', Mutibs.from_zeros(9)])
 
 def test_set_with_empty_sequence():
     # Setting with an empty sequence
@@ -458,6 +474,13 @@ def test_invert_with_range():
     a = Mutibs('0b1010')
     a.invert(range(2))
     assert a == '0b0110'
+    b = Mutibs('0b101100')
+    b.invert(range(-1, -7, -2))
+    assert b == '0b111001'
+    b.invert(range(3, 3))
+    assert b == '0b111001'
+    with pytest.raises(IndexError):
+        b.invert(range(4, 8))
 
 def test_invert_chaining():
     # Method chaining
@@ -660,6 +683,13 @@ def test_rol_large_rotation():
     a.rol(1000000)  # Should be equivalent to rol(0) since 1000000 % 4 = 0
     assert a == '0b1010'
 
+def test_rotate_empty_range():
+    # Rotating an empty range is a no-op
+    a = Mutibs('0b1010')
+    assert a.rol(3, start=2, end=2) is a
+    assert a.ror(3, start=4) is a
+    assert a == '0b1010'
+
 def test_ror_basic():
     # Basic rotate right functionality
     a = Mutibs('0b1010')
@@ -1070,4 +1100,27 @@ def test_to_bytes_bug():
     a = Mutibs.from_string('0xff')
     b = a[2:]
     c = b.to_bytes()
-    assert c == b'\xfc'
\ No newline at end of file
+    assert c == b'\xfc'
+
+
+def test_mutibs_xor_inplace():
+    a = Mutibs.from_random(1 << 16, b's')
+    b = Mutibs.from_random(1 << 16, b's')
+    c = a
+    a ^= b
+    assert a is c
+    assert a.count(1) == 0
+    a = Mutibs('0b1100')
+    a ^= '0b1010'
+    assert a == '0b0110'
+    a |= Tibs('0b1001')
+    assert a == '0b1111'
+    a &= '0b0101'
+    assert a == '0b0101'
+    a &= a
+    a |= a
+    assert a == '0b0101'
+    a ^= a
+    assert a == '0b0000'
+    with pytest.raises(ValueError):
+        a ^= '0b1'